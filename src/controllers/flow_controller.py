@@ -22,6 +22,9 @@ MFC_UNCERTAINTIES = {
     20: {'Rd': 0.5, 'FS': 0.1, 'FS_value': 1500.0, 'unit': 'mln/min'},   # Base gas (air): 1500 mL/min max
 }
 
+# Process 33 parameters returned by get_readings: (reading name, parameter number)
+READING_PARAMETERS = (('Flow', 0), ('Valve', 1), ('Temperature', 7))
+
 class FlowController:
     def __init__(self, port: str = None, addresses: list = None):
         self.port = port
@@ -234,17 +237,35 @@ class FlowController:
             # Use cached unit instead of reading it every time
             unit = self.units.get(address, "ln/min")
             
-            readings = {
-                'Flow': self.read_flow(address),
-                'Valve': self.read_valve(address),
-                'Temperature': self.read_temperature(address),
-                'Unit': unit
-            }
+            # Flow, valve and temperature chained in one propar message
+            instrument = self.instruments[address]
+            parameters = [
+                {'node': instrument.address, 'proc_nr': 33, 'parm_nr': parm_nr, 'parm_type': propar.PP_TYPE_FLOAT}
+                for _, parm_nr in READING_PARAMETERS
+            ]
+            values = instrument.read_parameters(parameters)
+            if values is None or len(values) != len(READING_PARAMETERS):
+                # No (complete) chained answer: fall back to one read per parameter
+                readings = {
+                    'Flow': self.read_flow(address),
+                    'Valve': self.read_valve(address),
+                    'Temperature': self.read_temperature(address),
+                }
+            else:
+                readings = {
+                    name: value.get('data') if value.get('status', 0) == 0 else None
+                    for (name, _), value in zip(READING_PARAMETERS, values)
+                }
+            readings['Unit'] = unit
             return readings
         except Exception as e:
             print(f"Error getting readings from address {address}: {e}")
             return {'Flow': None, 'Valve': None, 'Temperature': None, 'Unit': "ln/min"}
             
+    def get_readings_batch(self, addresses: List[int]) -> Dict[int, Dict[str, Any]]:
+        """Get readings from several instruments in one back-to-back pass"""
+        return {address: self.get_readings(address) for address in addresses}
+
     def is_connected(self) -> bool:
         """Check if we have active instrument connections"""
         return self.connected and bool(self.instruments)
@@ -258,6 +279,17 @@ class FlowController:
             print(f"Error reading flow: {address}")
             return None
     
+    def read_flows(self, addresses: List[int]) -> List[Optional[float]]:
+        """Read current flow in ln/min from several instruments back to back"""
+        flows = []
+        for address in addresses:
+            try:
+                flows.append(self.instruments[address].read(33, 0, propar.PP_TYPE_FLOAT))
+            except Exception as e:
+                print(f"Error reading flow: {address}")
+                flows.append(None)
+        return flows
+
     def read_valve(self, address: int) -> Optional[float]:
         """Read valve position in %"""
         try:
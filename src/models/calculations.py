@@ -1,5 +1,7 @@
 from typing import Tuple
 
+import numpy as np
+
 def calculate_flows_variable(C_tot_ppm: float, C1_ppm: float, C2_ppm: float, 
                            Q_max_individual: float = 1.5) -> Tuple[float, float]:
     """Calculate required flow rates for desired concentration.
@@ -98,16 +100,27 @@ def calculate_real_outflow(C1, V1, C2, V2):
     
     Args:
         C1: Concentration of first gas (ppm)
-        V1: Flow rate of first gas (ln/min)
+        V1: Flow rate of first gas (ln/min), a number or a numpy array
         C2: Concentration of second gas (ppm)
-        V2: Flow rate of second gas (ln/min)
+        V2: Flow rate of second gas (ln/min), a number or a numpy array
         
     Returns:
-        Final concentration (ppm) or 0 if inputs are invalid
+        Final concentration (ppm), or 0 if inputs are invalid or the total
+        flow is not positive. For array flows, an array with 0 wherever the
+        total flow is not positive.
     """
     # Check for None or invalid values
-    if None in (C1, V1, C2, V2) or (V1 + V2) == 0:
+    if C1 is None or V1 is None or C2 is None or V2 is None:
         return 0
-    
-    C_final = (C1*V1 + C2*V2)/(V1+V2)
-    return C_final
\ No newline at end of file
+
+    if np.ndim(V1) == 0 and np.ndim(V2) == 0:
+        if (V1 + V2) <= 0:
+            return 0
+        C_final = (C1*V1 + C2*V2)/(V1+V2)
+        return C_final
+
+    # Whole series at once
+    V1 = np.asarray(V1, dtype=float)
+    V2 = np.asarray(V2, dtype=float)
+    total = V1 + V2
+    return np.divide(C1*V1 + C2*V2, total, out=np.zeros_like(total), where=total > 0)
\ No newline at end of file
@@ -1,20 +1,130 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-from typing import Optional, List
+from typing import NamedTuple, Optional, List
 import os
+import stat
 import json
+import queue
 import time
-from threading import Thread
+from threading import Event, Thread
 from datetime import datetime
 
+import numpy as np
+
+from ..models.calculations import calculate_flows_for_total_flow
+
+
+class _PlannedStep(NamedTuple):
+    """Setpoints for one calibration step, resolved before the run starts"""
+    target_conc: float
+    Q_base: float
+    Q_input: float
+    addr_mix: Optional[int]  # None when no mix gas is needed
+    error: Optional[Exception]  # Why the flows could not be computed, if they could not
+
+
+def init_styles(root: tk.Misc) -> None:
+    """Apply the ttk style tweaks used by the calibration window, once per application."""
+    if getattr(root, '_calibration_styles_inited', False):
+        return
+    # Keep disabled buttons readable (e.g. "Enter Steps Manually" in automatic mode)
+    ttk.Style(root).map('TButton', foreground=[('disabled', '#000000')])
+    root._calibration_styles_inited = True
+
+
+def _linear_steps(initial: float, final: float, num_steps: int, back_forth: bool) -> List[float]:
+    """Return num_steps evenly spaced concentrations, optionally going back down."""
+    if num_steps < 2:
+        steps = np.array([initial])
+    else:
+        # Generate linear steps
+        steps = np.linspace(initial, final, num_steps)
+    # Add reverse order (excluding the last point to avoid duplication)
+    if back_forth and steps.size > 1:
+        steps = np.concatenate([steps, steps[-2::-1]])
+    # Keep a plain list for the rest of the window (enumerate, JSON, dialogs)
+    return steps.tolist()
+
+
+def _total_flow_splits(targets: List[float], base_conc: float, input_conc: float,
+                       total_flow: float) -> list:
+    """Return calculate_flows_for_total_flow for every target concentration.
+
+    Each entry is a (Q_base, Q_input) pair, or the exception raised for that
+    target. The mix is solved for all targets at once; only the targets it
+    cannot solve go through the scalar function, to get its error.
+    """
+    def split(target_conc):
+        try:
+            return calculate_flows_for_total_flow(
+                float(target_conc), float(base_conc), float(input_conc), float(total_flow)
+            )
+        except Exception as e:
+            return e
+
+    # Degenerate mixes: let the scalar function report the error for each target
+    if total_flow <= 0 or base_conc == input_conc:
+        return [split(target_conc) for target_conc in targets]
+
+    conc = np.asarray(targets, dtype=float)
+    q_base_ratio = (conc - input_conc) / (base_conc - input_conc)
+    Q_base = np.maximum(0.0, total_flow * q_base_ratio)
+    Q_input = np.maximum(0.0, total_flow * (1.0 - q_base_ratio))
+    splits = list(zip(Q_base.tolist(), Q_input.tolist()))
+
+    # Targets outside the achievable range get the scalar function's error
+    unreachable = (conc < min(base_conc, input_conc)) | (conc > max(base_conc, input_conc))
+    for i in np.flatnonzero(unreachable).tolist():
+        splits[i] = split(targets[i])
+    return splits
+
 
 class CalibrationWindow(tk.Toplevel):
     """Window for concentration calibration routine mode"""
+
+    # Above this many steps the preview switches from the listbox to a text view
+    LARGE_STEP_COUNT = 200
+    # Interval at which calibration progress is applied to the widgets
+    UI_POLL_MS = 100
+    # Delay before recomputing the preview after a configuration edit
+    PREVIEW_DEBOUNCE_MS = 150
+
+    # Step duration units and how the estimated total time is displayed
+    _UNIT_TO_SECONDS = {"seconds": 1.0, "minutes": 60.0, "hours": 3600.0}
+    _TIME_THRESHOLDS = (
+        (3600, 3600, 'hours', '{:.1f}'),
+        (60, 60, 'minutes', '{:.1f}'),
+        (float('-inf'), 1, 'seconds', '{:.0f}'),
+    )
+
+    # Settings file key -> Tk variable attribute, for everything persisted between sessions
+    _PERSISTED_VARS = (
+        ('directory', 'directory_var'),
+        ('base_concentration', 'base_concentration_var'),
+        ('input_concentration', 'input_concentration_var'),
+        ('total_flow', 'total_flow_var'),
+        ('flow_unit', 'flow_unit_var'),
+        ('step_number', 'step_number_var'),
+        ('step_mode', 'step_mode_var'),
+        ('initial_conc', 'initial_conc_var'),
+        ('final_conc', 'final_conc_var'),
+        ('step_duration', 'step_duration_var'),
+        ('duration_unit', 'duration_unit_var'),
+        ('back_forth', 'back_forth_var'),
+        ('addr_neutral', 'addr_neutral'),
+        ('addr_mix_high', 'addr_mix_high'),
+        ('addr_mix_med', 'addr_mix_med'),
+        ('addr_mix_low', 'addr_mix_low'),
+        ('addr_helium', 'addr_helium'),
+    )
     
     def __init__(self, parent, controller):
         super().__init__(parent)
         self.controller = controller
         self.parent_window = parent
+        # Resolve optional parent hooks once instead of probing with hasattr on every step
+        self._log = getattr(parent, 'print_to_command_output', None) or (lambda message, msg_type='info': None)
+        self._select_instr = getattr(parent, 'select_best_instrument_for_flow', None)
         self.title("Concentration Calibration Routine Mode")
         self.geometry("1050x900")  # Default window size
         self.resizable(True, True)
@@ -45,11 +155,23 @@ class CalibrationWindow(tk.Toplevel):
         
         # Store computed steps
         self.computed_steps = []
+        self._last_lines = None  # Lines currently shown in the step listbox
+        self._preview_after_id = None  # Pending debounced preview update
+        self._last_estimate_str = "N/A"  # Estimated run time shown in the summary
         
         # Calibration state
         self.is_running = False
         self.current_step = 0
+        # Set on Stop/close so the calibration thread wakes from its wait at once
+        self._stop_event = Event()
         self.calibration_thread = None
+        self._run_total_steps = 0
+        self._shown_progress = None  # (percent, step) currently displayed
+        self.run_status_var = tk.StringVar(value="")
+
+        # UI updates posted by the calibration thread, applied by _drain_ui_queue
+        self._ui_queue = queue.Queue()
+        self._poll_id = None
         
         # Gas address configuration
         self.addr_neutral = tk.IntVar(value=saved_settings.get('addr_neutral', 20))  # Default: air at 20
@@ -65,9 +187,17 @@ class CalibrationWindow(tk.Toplevel):
         # Pull initial values from main window if available
         self._sync_from_main_window_initial()
         self._setup_two_way_sync_with_main_window()
+
+        # Set by any edit to a persisted variable; save_settings skips the write when clear.
+        # Traced only after the initial sync so re-setting the same values does not count
+        self._saved_settings = saved_settings  # Contents of the file on disk
+        self._settings_dirty = self._current_settings() != saved_settings
+        for _, attr in self._PERSISTED_VARS:
+            getattr(self, attr).trace_add('write', self._mark_settings_dirty)
         
         self.setup_gui()
-        self.update_step_preview()
+        # Let the window paint before computing and displaying the steps
+        self.after_idle(self.update_step_preview)
         
         # Save settings on close
         self.protocol("WM_DELETE_WINDOW", self.on_close)
@@ -82,7 +212,24 @@ class CalibrationWindow(tk.Toplevel):
         self.rowconfigure(0, weight=1)
         main_frame.columnconfigure(0, weight=1)
         main_frame.columnconfigure(1, weight=1)
+        self._main_frame = main_frame
+        
+        self._build_left_panel(main_frame)
+
+        # The step preview panel is only built once the window is mapped
+        self._right_panel_built = False
+        self._right_placeholder = ttk.Label(main_frame, text="Loading step preview...",
+                                            font=('Segoe UI', 9, 'italic'))
+        self._right_placeholder.grid(row=0, column=1, sticky=(tk.N, tk.W), padx=(5, 0))
+        self.bind('<Map>', self._ensure_right_panel)
         
+        # Bind variables to auto-update
+        for var in (self.initial_conc_var, self.final_conc_var, self.step_number_var,
+                    self.base_concentration_var, self.input_concentration_var):
+            var.trace_add('write', self._on_config_changed)
+
+    def _build_left_panel(self, main_frame):
+        """Build the configuration and action panel"""
         # === LEFT PANEL: Configuration ===
         left_frame = ttk.LabelFrame(main_frame, text="Calibration Configuration", padding="10")
         left_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), padx=(0, 5))
@@ -196,8 +343,7 @@ class CalibrationWindow(tk.Toplevel):
                                        command=self.open_manual_entry, state='disabled')
         self.manual_button.grid(row=0, column=1, padx=(10, 0))
         # Force button to use normal foreground color even when disabled
-        self.style = ttk.Style()
-        self.style.map('TButton', foreground=[('disabled', '#000000')])
+        init_styles(self._root())
         
         # Automatic mode
         ttk.Radiobutton(mode_frame, text="Automatic Computation", 
@@ -268,7 +414,20 @@ class CalibrationWindow(tk.Toplevel):
                   command=self.export_config).pack(side=tk.LEFT, padx=(0, 5), fill=tk.X, expand=True)
         ttk.Button(button_row2, text="✖ Close", 
                   command=self.on_close).pack(side=tk.LEFT, fill=tk.X, expand=True)
-        
+
+    def _ensure_right_panel(self, event=None):
+        """Build the step preview panel on first display"""
+        if self._right_panel_built:
+            return
+        self._right_panel_built = True
+        self.unbind('<Map>')
+        self._right_placeholder.destroy()
+        self._build_right_panel(self._main_frame)
+        self._last_lines = None
+        self.update_step_display()
+
+    def _build_right_panel(self, main_frame):
+        """Build the step preview, summary and progress widgets"""
         # === RIGHT PANEL: Step Preview ===
         right_frame = ttk.LabelFrame(main_frame, text="Step Preview", padding="10")
         right_frame.grid(row=0, column=1, sticky=(tk.W, tk.E, tk.N, tk.S), padx=(5, 0))
@@ -293,6 +452,14 @@ class CalibrationWindow(tk.Toplevel):
         self.step_listbox = tk.Listbox(list_frame, yscrollcommand=scrollbar.set,
                                        font=('Consolas', 9), height=16)
         self.step_listbox.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+
+        # Read-only text view used instead of the listbox for long step lists
+        # (one insert of the joined lines is much cheaper than a listbox item per step)
+        self.step_text = tk.Text(list_frame, yscrollcommand=scrollbar.set,
+                                 font=('Consolas', 9), height=16, wrap='none',
+                                 state='disabled')
+        self._step_scrollbar = scrollbar
+        self._step_view = self.step_listbox
         scrollbar.config(command=self.step_listbox.yview)
         
         # Summary label
@@ -310,14 +477,31 @@ class CalibrationWindow(tk.Toplevel):
                                            length=300, maximum=100)
         self.progress_bar.grid(row=4, column=0, sticky=(tk.W, tk.E), pady=(0, 5))
         self.progress_bar['value'] = 0
+
+        # Outcome of the last run (completion is reported here instead of a modal dialog)
+        ttk.Label(right_frame, textvariable=self.run_status_var, font=('Segoe UI', 9),
+                  wraplength=400, justify=tk.LEFT).grid(row=5, column=0, sticky=tk.W)
         
-        # Bind variables to auto-update
-        self.initial_conc_var.trace('w', lambda *args: self.update_step_preview())
-        self.final_conc_var.trace('w', lambda *args: self.update_step_preview())
-        self.step_number_var.trace('w', lambda *args: self.update_step_preview())
-        self.base_concentration_var.trace('w', lambda *args: self.update_step_preview())
-        self.input_concentration_var.trace('w', lambda *args: self.update_step_preview())
-        
+    def _on_config_changed(self, *args):
+        """Trace callback for the step configuration variables"""
+        self._schedule_preview()
+
+    def _schedule_preview(self):
+        """Debounce step preview updates while the user is typing"""
+        if self._preview_after_id is not None:
+            self.after_cancel(self._preview_after_id)
+        self._preview_after_id = self.after(self.PREVIEW_DEBOUNCE_MS, self._run_scheduled_preview)
+
+    def _run_scheduled_preview(self):
+        self._preview_after_id = None
+        self.update_step_preview()
+
+    def _flush_pending_preview(self):
+        """Apply a pending debounced preview now so computed_steps is current"""
+        if self._preview_after_id is not None:
+            self.after_cancel(self._preview_after_id)
+            self._run_scheduled_preview()
+
     def select_directory(self):
         """Open directory selection dialog"""
         directory = filedialog.askdirectory(
@@ -381,29 +565,45 @@ class CalibrationWindow(tk.Toplevel):
                     self.final_conc_var.set(str(clamped_final))
                     final = clamped_final
                 
-                if num_steps < 2:
-                    self.computed_steps = [initial]
-                else:
-                    # Generate linear steps
-                    step_size = (final - initial) / (num_steps - 1)
-                    self.computed_steps = [initial + i * step_size for i in range(num_steps)]
-                
-                # Add back and forth if enabled
-                if self.back_forth_var.get() and len(self.computed_steps) > 1:
-                    # Add reverse order (excluding the last point to avoid duplication)
-                    self.computed_steps.extend(reversed(self.computed_steps[:-1]))
+                self.computed_steps = _linear_steps(initial, final, num_steps,
+                                                    self.back_forth_var.get())
                     
             except ValueError:
                 self.computed_steps = []
         
         self.update_step_display()
         
+    def _show_step_view(self, view):
+        """Grid the given step widget (listbox or text) in place of the other"""
+        if view is self._step_view:
+            return
+        self._step_view.grid_remove()
+        view.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self._step_scrollbar.config(command=view.yview)
+        self._step_view = view
+
     def update_step_display(self):
         """Update the listbox with computed steps"""
-        self.step_listbox.delete(0, tk.END)
-        
-        for i, step in enumerate(self.computed_steps, 1):
-            self.step_listbox.insert(tk.END, f"Step {i:3d}: {step:8.2f} ppm")
+        if not self._right_panel_built:
+            return  # Shown by _ensure_right_panel once the window is mapped
+
+        lines = [f"Step {i:3d}: {step:8.2f} ppm" for i, step in enumerate(self.computed_steps, 1)]
+
+        # Only rebuild the step view when the steps actually changed
+        # (e.g. editing the duration only affects the summary)
+        if lines != self._last_lines:
+            if len(lines) > self.LARGE_STEP_COUNT:
+                self._show_step_view(self.step_text)
+                self.step_text.config(state='normal')
+                self.step_text.delete('1.0', tk.END)
+                self.step_text.insert('1.0', '\n'.join(lines))
+                self.step_text.config(state='disabled')
+            else:
+                self._show_step_view(self.step_listbox)
+                self.step_listbox.delete(0, tk.END)
+                if lines:
+                    self.step_listbox.insert(tk.END, *lines)
+            self._last_lines = lines
         
         # Update summary
         if self.computed_steps:
@@ -411,36 +611,39 @@ class CalibrationWindow(tk.Toplevel):
             try:
                 duration = float(self.step_duration_var.get())
                 unit = self.duration_unit_var.get()
-                total_time = total_steps * duration
-                
-                # Convert to appropriate unit
-                if unit == "seconds":
-                    if total_time >= 3600:
-                        time_str = f"{total_time/3600:.1f} hours"
-                    elif total_time >= 60:
-                        time_str = f"{total_time/60:.1f} minutes"
-                    else:
-                        time_str = f"{total_time:.0f} seconds"
-                elif unit == "minutes":
-                    if total_time >= 60:
-                        time_str = f"{total_time/60:.1f} hours"
-                    else:
-                        time_str = f"{total_time:.0f} minutes"
-                else:  # hours
-                    time_str = f"{total_time:.1f} hours"
+                total_seconds = total_steps * self._convert_duration_to_seconds(duration, unit)
+
+                # Express the total in the largest unit it reaches
+                for threshold, divisor, label, fmt in self._TIME_THRESHOLDS:
+                    if total_seconds >= threshold:
+                        time_str = f"{fmt.format(total_seconds / divisor)} {label}"
+                        break
+                else:
+                    time_str = "N/A"  # NaN duration matches no threshold
                 
+                self._last_estimate_str = time_str
                 self.summary_label.config(
                     text=f"Total: {total_steps} steps | Estimated time: {time_str}"
                 )
             except ValueError:
+                self._last_estimate_str = "N/A"
                 self.summary_label.config(text=f"Total: {total_steps} steps")
         else:
+            self._last_estimate_str = "N/A"
             self.summary_label.config(text="No steps configured")
             
     def start_routine(self):
         """Start the calibration routine"""
+        self._ensure_right_panel()
+        self._flush_pending_preview()
+
         # Validate configuration
-        if self.directory_var.get() == "No directory selected" or not os.path.exists(self.directory_var.get()):
+        log_dir = self.directory_var.get()
+        try:
+            dir_ok = stat.S_ISDIR(os.stat(log_dir).st_mode)
+        except OSError:
+            dir_ok = False
+        if not dir_ok or log_dir == "No directory selected":
             messagebox.showerror("Error", "Please select a valid directory for data logging.")
             return
             
@@ -482,35 +685,47 @@ class CalibrationWindow(tk.Toplevel):
         response = messagebox.askyesno(
             "Start Calibration",
             f"Start calibration routine with {len(self.computed_steps)} steps?\n\n"
-            f"This will take approximately {self.summary_label.cget('text').split('Estimated time: ')[1]}",
+            f"This will take approximately {self._last_estimate_str}",
             icon='question'
         )
         
         if response:
             # Save settings before starting
             self.save_settings()
+
+            # Read everything the run needs from Tk here, on the Tk thread
+            duration_seconds = self._convert_duration_to_seconds(step_duration, self.duration_unit_var.get())
+            addr_neutral = self.addr_neutral.get()
+            available_addrs = [self.addr_mix_high.get(), self.addr_mix_med.get(), self.addr_mix_low.get()]
+
+            # Resolve flows and instruments for every step up front so the
+            # timed loop only has to dispatch setpoints and sample
+            plan = self._plan_steps(base_conc, input_conc, total_flow, available_addrs)
             
             # Reset and update UI
             self.progress_bar['value'] = 0
             self.progress_label.config(text="Progress: 0%")
+            self._shown_progress = None
+            self._run_total_steps = len(plan)
+            self.run_status_var.set("")
             self.start_button.config(state='disabled')
             self.stop_button.config(state='normal')
             
             # Start calibration in separate thread
             self.is_running = True
+            self._stop_event.clear()
             self.calibration_thread = Thread(target=self._run_calibration, 
-                                            args=(input_conc, total_flow, step_duration), 
+                                            args=(log_dir, plan, base_conc, input_conc, duration_seconds,
+                                                  addr_neutral, available_addrs), 
                                             daemon=True)
             self.calibration_thread.start()
+            if self._poll_id is None:
+                self._poll_id = self.after(self.UI_POLL_MS, self._drain_ui_queue)
             
             # Notify parent window
-            if hasattr(self.parent_window, 'print_to_command_output'):
-                self.parent_window.print_to_command_output(
-                    f"Calibration routine started: {len(self.computed_steps)} steps", 'success'
-                )
-                # Set calibration mode flag
-                self.parent_window.in_calibration_mode = True
-                self.parent_window.calibration_status_var.set("CALIBRATION MODE ACTIVE")
+            self._log(f"Calibration routine started: {len(self.computed_steps)} steps", 'success')
+            # Set calibration mode flag
+            self._set_parent_calibration_mode(True)
     
     def stop_routine(self):
         """Stop the calibration routine"""
@@ -522,184 +737,241 @@ class CalibrationWindow(tk.Toplevel):
             )
             if response:
                 self.is_running = False
+                self._stop_event.set()
+                self.run_status_var.set("Calibration stopped by user.")
                 self.start_button.config(state='normal')
                 self.stop_button.config(state='disabled')
-                if hasattr(self.parent_window, 'print_to_command_output'):
-                    self.parent_window.print_to_command_output(
-                        "Calibration routine stopped by user", 'warning'
-                    )
-                    self.parent_window.in_calibration_mode = False
-                    self.parent_window.calibration_status_var.set("")
+                self._log("Calibration routine stopped by user", 'warning')
+                self._set_parent_calibration_mode(False)
     
-    def _run_calibration(self, input_conc: float, total_flow: float, step_duration: float):
-        """Run the calibration routine in a separate thread"""
+    def _run_calibration(self, log_dir: str, plan: List[_PlannedStep], base_conc: float, input_conc: float,
+                         duration_seconds: float, addr_neutral: int, available_addrs: List[int]):
+        """Run the calibration routine in a separate thread.
+
+        The thread only talks to the instruments and the log file. UI updates are
+        posted to self._ui_queue and applied on the Tk thread by _drain_ui_queue.
+        """
+        post = self._ui_queue.put
         try:
             # Create log file
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            log_file = os.path.join(self.directory_var.get(), f"calibration_{timestamp}.csv")
-            
-            with open(log_file, 'w') as f:
-                f.write("Step,Target_Conc_ppm,Actual_Conc_ppm,Base_Flow_Lmin,Variable_Flow_Lmin,Variable_Instrument,Timestamp\n")
-            
-            duration_seconds = self._convert_duration_to_seconds(step_duration, self.duration_unit_var.get())
+            log_file = os.path.join(log_dir, f"calibration_{timestamp}.csv")
+            total_steps = len(plan)
+            wait_for_stop = self._stop_event.wait
 
-            # Keep base concentration stable during a run
-            try:
-                base_conc = float(self.base_concentration_var.get())
-            except Exception:
-                base_conc = 0.0
+            # Only talk to an instrument when its setpoint actually changes
+            # (e.g. the unused mix instruments stay at 0 between steps)
+            last_flows = {}
+
+            def write_flow(addr: int, flow: float):
+                previous = last_flows.get(addr)
+                if previous is not None and abs(previous - flow) <= 1e-9:
+                    return
+                if self.controller.set_flow(addr, flow):
+                    last_flows[addr] = flow
             
-            for step_num, target_conc in enumerate(self.computed_steps, 1):
-                if not self.is_running:
-                    break
+            # Open the log once for the whole run; the with-block closes it even on errors.
+            # Rows are formatted straight to ASCII bytes into a buffered file, which is
+            # flushed after every step so a crash mid-run keeps the completed steps.
+            with open(log_file, 'wb') as log_fh:
+                write = log_fh.write
+                now = datetime.now
+                write(b"Step,Target_Conc_ppm,Actual_Conc_ppm,Base_Flow_Lmin,"
+                      b"Variable_Flow_Lmin,Variable_Instrument,Timestamp\n")
+
+                # One timeline for the whole run: each step ends duration_seconds after
+                # the previous one, so time spent sending setpoints does not add up
+                deadline = time.monotonic()
+                for step_num, (target_conc, Q_base, Q_input, addr_mix, plan_error) in enumerate(plan, 1):
+                    if not self.is_running:
+                        break
                 
-                self.current_step = step_num
+                    self.current_step = step_num
+                    step_start = deadline
+                    deadline += duration_seconds
                 
-                # Update progress bar
-                progress = (step_num / len(self.computed_steps)) * 100
-                self.after(0, lambda p=progress, s=step_num: self._update_progress(p, s))
+                    # Update progress bar
+                    progress = (step_num / total_steps) * 100
+                    post(('progress', progress, step_num))
                 
-                # Update status in parent window
-                if hasattr(self.parent_window, 'print_to_command_output'):
-                    self.parent_window.print_to_command_output(
-                        f"Calibration Step {step_num}/{len(self.computed_steps)}: {target_conc:.2f} ppm", 'info'
-                    )
-
-                # Sync concentrations back to main window controls (so you see live targets)
-                if hasattr(self.parent_window, 'variables') and isinstance(getattr(self.parent_window, 'variables', None), dict):
-                    try:
-                        self.parent_window.variables['C_tot_ppm'].set(float(target_conc))
-                        self.parent_window.variables['C1_ppm'].set(float(base_conc))
-                        self.parent_window.variables['C2_ppm'].set(float(input_conc))
-                    except Exception:
-                        pass
+                    # Update status in parent window and show the live targets there
+                    post(('log', f"Calibration Step {step_num}/{total_steps}: {target_conc:.2f} ppm", 'info'))
+                    post(('step', target_conc, base_conc, input_conc, addr_mix))
                 
-                # Calculate required flows
-                try:
-                    from ..models.calculations import calculate_flows_for_total_flow
-
-                    # Compute flows for a fixed total flow
-                    Q_base, Q_input = calculate_flows_for_total_flow(
-                        float(target_conc),
-                        float(base_conc),
-                        float(input_conc),
-                        float(total_flow)
-                    )
-
-                    # Get neutral gas (base) address
-                    addr_neutral = self.addr_neutral.get()
-                    available_addrs = [self.addr_mix_high.get(), self.addr_mix_med.get(), self.addr_mix_low.get()]
-
-                    # Select an instrument for the input gas (may be 0)
-                    addr_mix = None
-                    if Q_input > 0:
-                        if hasattr(self.parent_window, 'select_best_instrument_for_flow'):
-                            addr_mix = self.parent_window.select_best_instrument_for_flow(Q_input)
-                            if hasattr(self.parent_window, 'current_gas2_address'):
-                                self.parent_window.current_gas2_address = addr_mix
-                            if addr_mix not in available_addrs:
-                                addr_mix = available_addrs[0]
-                        else:
-                            addr_mix = self.addr_mix_high.get()
-
-                    # Apply flows
-                    self.controller.set_flow(addr_neutral, Q_base)
-                    if addr_mix is not None:
-                        self.controller.set_flow(addr_mix, Q_input)
-
-                    # Stop other mix gas instruments
-                    for addr in available_addrs:
-                        if addr_mix is None or addr != addr_mix:
-                            self.controller.set_flow(addr, 0)
-
-                    # Store for data logging
-                    addr_base = addr_neutral
-                    addr_variable = addr_mix
-                    Q1 = Q_base
-                    Q2 = Q_input
-
-                    if hasattr(self.parent_window, 'print_to_command_output'):
+                    # Apply the precomputed flows for this step
+                    try:
+                        if plan_error is not None:
+                            raise plan_error
+
+                        # Apply flows
+                        write_flow(addr_neutral, Q_base)
+                        if addr_mix is not None:
+                            write_flow(addr_mix, Q_input)
+
+                        # Stop other mix gas instruments
+                        for addr in available_addrs:
+                            if addr_mix is None or addr != addr_mix:
+                                write_flow(addr, 0)
+
+                        # Store for data logging
+                        addr_base = addr_neutral
+                        addr_variable = addr_mix
+
                         mix_addr_str = str(addr_mix) if addr_mix is not None else "None"
-                        self.parent_window.print_to_command_output(
-                            f"  Flows set: Base (addr {addr_neutral})={Q_base:.6f} L/min, Input (addr {mix_addr_str})={Q_input:.6f} L/min",
-                            'info'
-                        )
+                        post(('log',
+                              f"  Flows set: Base (addr {addr_neutral})={Q_base:.6f} L/min, Input (addr {mix_addr_str})={Q_input:.6f} L/min",
+                              'info'))
                     
-                    # Log one value per second (resolution point)
-                    start_t = time.time()
-                    next_sample_t = start_t
-                    while self.is_running and (time.time() - start_t) < duration_seconds:
-                        now_t = time.time()
-                        if now_t < next_sample_t:
-                            time.sleep(min(0.2, next_sample_t - now_t))
-                            continue
-
-                        # Read actual values
-                        actual_flow1 = self.controller.read_flow(addr_base) or 0
-                        actual_flow2 = 0
-                        if addr_variable is not None:
-                            actual_flow2 = self.controller.read_flow(addr_variable) or 0
-
-                        # Calculate actual concentration
-                        if (actual_flow1 + actual_flow2) > 0:
-                            actual_conc = (base_conc * actual_flow1 + input_conc * actual_flow2) / (actual_flow1 + actual_flow2)
-                        else:
-                            actual_conc = 0
-
-                        # Log to file
-                        with open(log_file, 'a') as f:
-                            f.write(
-                                f"{step_num},{target_conc:.2f},{actual_conc:.2f},"
-                                f"{actual_flow1:.4f},{actual_flow2:.4f},{addr_variable or 0},{datetime.now().isoformat()}\n"
-                            )
-
-                        next_sample_t += 1.0
+                        # Both flows are sampled in one back-to-back read
+                        sample_addrs = [addr_base] if addr_variable is None else [addr_base, addr_variable]
+                        logged_addr = addr_variable or 0  # 0 when no mix instrument is used
+
+                        # Log one value per second (resolution point)
+                        next_sample_t = max(step_start, time.monotonic())
+                        while self.is_running and time.monotonic() < deadline:
+                            now_t = time.monotonic()
+                            if now_t < next_sample_t:
+                                # Returns early as soon as Stop sets the event
+                                wait_for_stop(min(next_sample_t, deadline) - now_t)
+                                continue
+
+                            # Read actual values
+                            flows = self.controller.read_flows(sample_addrs)
+                            actual_flow1 = flows[0] or 0
+                            actual_flow2 = (flows[1] or 0) if len(flows) > 1 else 0
+
+                            # Calculate actual concentration
+                            if (actual_flow1 + actual_flow2) > 0:
+                                actual_conc = (base_conc * actual_flow1 + input_conc * actual_flow2) / (actual_flow1 + actual_flow2)
+                            else:
+                                actual_conc = 0
+
+                            # Log to file
+                            write(b"%d,%.2f,%.2f,%.4f,%.4f,%d,%s\n" % (
+                                step_num, target_conc, actual_conc,
+                                actual_flow1, actual_flow2, logged_addr,
+                                now().isoformat(timespec='seconds').encode('ascii')
+                            ))
+
+                            next_sample_t += 1.0
                     
-                except Exception as e:
-                    if hasattr(self.parent_window, 'print_to_command_output'):
-                        self.parent_window.print_to_command_output(
-                            f"Error in step {step_num}: {e}", 'error'
-                        )
+                    except Exception as e:
+                        post(('log', f"Error in step {step_num}: {e}", 'error'))
+
+                    log_fh.flush()
             
             # Calibration complete
             self.is_running = False
-            self.after(0, lambda: self.start_button.config(state='normal'))
-            self.after(0, lambda: self.stop_button.config(state='disabled'))
-            self.after(0, lambda: self._update_progress(100, len(self.computed_steps)))
-            
-            if hasattr(self.parent_window, 'print_to_command_output'):
-                self.parent_window.print_to_command_output(
-                    f"Calibration routine completed. Data saved to: {log_file}", 'success'
-                )
-                self.parent_window.in_calibration_mode = False
-                self.parent_window.calibration_status_var.set("")
+            post(('log', f"Calibration routine completed. Data saved to: {log_file}", 'success'))
             
             # Stop all flows
             self.controller.stop_all()
-            
-            messagebox.showinfo("Calibration Complete", 
-                              f"Calibration routine finished.\n\nData saved to:\n{log_file}")
+            post(('finished', log_file))
             
         except Exception as e:
             self.is_running = False
-            if hasattr(self.parent_window, 'print_to_command_output'):
-                self.parent_window.print_to_command_output(f"Calibration error: {e}", 'error')
-                self.parent_window.in_calibration_mode = False
-                self.parent_window.calibration_status_var.set("")
-            messagebox.showerror("Calibration Error", f"An error occurred:\n{str(e)}")
+            post(('log', f"Calibration error: {e}", 'error'))
+            post(('error', str(e)))
     
+    def _plan_steps(self, base_conc: float, input_conc: float, total_flow: float,
+                    available_addrs: List[int]) -> List[_PlannedStep]:
+        """Compute the flows and mix instrument for every calibration step.
+
+        If the flows for a step cannot be computed, its error holds the exception
+        and the step is reported when the run reaches it.
+        """
+        plan = []
+        splits = _total_flow_splits(self.computed_steps, base_conc, input_conc, total_flow)
+        for target_conc, flows in zip(self.computed_steps, splits):
+            if isinstance(flows, Exception):
+                plan.append(_PlannedStep(target_conc, 0.0, 0.0, None, flows))
+                continue
+            Q_base, Q_input = flows
+
+            # Select an instrument for the input gas (may be 0)
+            addr_mix = None
+            if Q_input > 0:
+                if self._select_instr is not None:
+                    addr_mix = self._select_instr(Q_input, quiet=True)
+                    if addr_mix not in available_addrs:
+                        addr_mix = available_addrs[0]
+                else:
+                    addr_mix = available_addrs[0]
+
+            plan.append(_PlannedStep(target_conc, Q_base, Q_input, addr_mix, None))
+        return plan
+
+    def _set_parent_calibration_mode(self, active: bool):
+        """Mirror the calibration state on the main window, if it supports it"""
+        if hasattr(self.parent_window, 'calibration_status_var'):
+            self.parent_window.in_calibration_mode = active
+            self.parent_window.calibration_status_var.set("CALIBRATION MODE ACTIVE" if active else "")
+
     def _convert_duration_to_seconds(self, duration: float, unit: str) -> float:
         """Convert duration to seconds"""
-        if unit == "minutes":
-            return duration * 60
-        elif unit == "hours":
-            return duration * 3600
-        return duration  # already in seconds
+        return duration * self._UNIT_TO_SECONDS.get(unit, 1.0)
     
+    def _drain_ui_queue(self):
+        """Apply UI updates posted by the calibration thread (runs on the Tk thread)"""
+        # Check before draining so messages posted just before the thread exits are not lost
+        thread_alive = self.calibration_thread is not None and self.calibration_thread.is_alive()
+
+        last_progress = None
+        while True:
+            try:
+                msg = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            kind = msg[0]
+            if kind == 'progress':
+                last_progress = msg[1:]  # Only the latest position needs drawing
+            elif kind == 'log':
+                self._log(msg[1], msg[2])
+            elif kind == 'step':
+                self._show_step_on_parent(*msg[1:])
+            elif kind == 'finished':
+                self.start_button.config(state='normal')
+                self.stop_button.config(state='disabled')
+                self._update_progress(100, self._run_total_steps)
+                last_progress = None
+                self._set_parent_calibration_mode(False)
+                if not self._stop_event.is_set():  # Keep the "stopped" status after a user stop
+                    self.run_status_var.set(f"Calibration complete. Data saved to:\n{msg[1]}")
+            elif kind == 'error':
+                self.start_button.config(state='normal')
+                self.stop_button.config(state='disabled')
+                self._set_parent_calibration_mode(False)
+                self.run_status_var.set("Calibration failed.")
+                messagebox.showerror("Calibration Error", f"An error occurred:\n{msg[1]}")
+        if last_progress is not None:
+            self._update_progress(*last_progress)
+
+        if thread_alive:
+            self._poll_id = self.after(self.UI_POLL_MS, self._drain_ui_queue)
+        else:
+            self._poll_id = None
+
+    def _show_step_on_parent(self, target_conc: float, base_conc: float, input_conc: float, addr_mix):
+        """Sync the current step's concentrations and mix instrument to the main window"""
+        if addr_mix is not None and hasattr(self.parent_window, 'current_gas2_address'):
+            self.parent_window.current_gas2_address = addr_mix
+        # Sync concentrations back to main window controls (so you see live targets)
+        if hasattr(self.parent_window, 'variables') and isinstance(getattr(self.parent_window, 'variables', None), dict):
+            try:
+                self.parent_window.variables['C_tot_ppm'].set(float(target_conc))
+                self.parent_window.variables['C1_ppm'].set(float(base_conc))
+                self.parent_window.variables['C2_ppm'].set(float(input_conc))
+            except Exception:
+                pass
+
     def _update_progress(self, progress: float, step: int):
         """Update progress bar and label (must be called from main thread)"""
+        shown = (round(progress), step)
+        if shown == self._shown_progress:
+            return  # Same percentage and step as on screen
+        self._shown_progress = shown
         self.progress_bar['value'] = progress
-        self.progress_label.config(text=f"Progress: {progress:.0f}% (Step {step}/{len(self.computed_steps)})")
+        self.progress_label.config(text=f"Progress: {progress:.0f}% (Step {step}/{self._run_total_steps})")
     
     def load_settings(self) -> dict:
         """Load saved settings from file"""
@@ -711,30 +983,33 @@ class CalibrationWindow(tk.Toplevel):
                 pass
         return {}
     
+    def _current_settings(self) -> dict:
+        """Return the current value of every persisted setting"""
+        return {key: getattr(self, attr).get() for key, attr in self._PERSISTED_VARS}
+
+    def _mark_settings_dirty(self, *args):
+        """Trace callback: a persisted setting was edited"""
+        self._settings_dirty = True
+
     def save_settings(self):
         """Save current settings to file"""
-        settings = {
-            'directory': self.directory_var.get(),
-            'base_concentration': self.base_concentration_var.get(),
-            'input_concentration': self.input_concentration_var.get(),
-            'total_flow': self.total_flow_var.get(),
-            'flow_unit': self.flow_unit_var.get(),
-            'step_number': self.step_number_var.get(),
-            'step_mode': self.step_mode_var.get(),
-            'initial_conc': self.initial_conc_var.get(),
-            'final_conc': self.final_conc_var.get(),
-            'step_duration': self.step_duration_var.get(),
-            'duration_unit': self.duration_unit_var.get(),
-            'back_forth': self.back_forth_var.get(),
-            'addr_neutral': self.addr_neutral.get(),
-            'addr_mix_high': self.addr_mix_high.get(),
-            'addr_mix_med': self.addr_mix_med.get(),
-            'addr_mix_low': self.addr_mix_low.get(),
-            'addr_helium': self.addr_helium.get()
-        }
+        if not self._settings_dirty:
+            return  # Nothing changed since the last save
+        settings = self._current_settings()
+        if settings == self._saved_settings:
+            # Values were re-set (e.g. by the main window sync) but are unchanged
+            self._settings_dirty = False
+            return
         try:
-            with open(self.settings_file, 'w') as f:
-                json.dump(settings, f, indent=2)
+            payload = json.dumps(settings, separators=(',', ':'))
+            # Write next to the real file and swap it in, so an interrupted
+            # save never leaves a truncated settings file behind
+            tmp_file = self.settings_file + '.tmp'
+            with open(tmp_file, 'w') as f:
+                f.write(payload)
+            os.replace(tmp_file, self.settings_file)
+            self._saved_settings = settings
+            self._settings_dirty = False
         except Exception as e:
             print(f"Error saving settings: {e}")
     
@@ -750,9 +1025,17 @@ class CalibrationWindow(tk.Toplevel):
             if not response:
                 return
             self.is_running = False
+            self._stop_event.set()
             if self.calibration_thread:
                 self.calibration_thread.join(timeout=2)
         
+        if self._preview_after_id is not None:
+            self.after_cancel(self._preview_after_id)
+            self._preview_after_id = None
+        if self._poll_id is not None:
+            self.after_cancel(self._poll_id)
+            self._poll_id = None
+
         # Save settings
         self.save_settings()
         
@@ -772,6 +1055,7 @@ class CalibrationWindow(tk.Toplevel):
     
     def export_config(self):
         """Export the configuration to a file"""
+        self._flush_pending_preview()
         if not self.computed_steps:
             messagebox.showwarning("Warning", "No steps to export.")
             return
@@ -784,17 +1068,21 @@ class CalibrationWindow(tk.Toplevel):
         
         if filename:
             try:
+                settings = self._current_settings()
+                parts = [
+                    "=== Calibration Routine Configuration ===\n\n",
+                    f"Data Directory: {settings['directory']}\n",
+                    f"Base Gas Concentration: {settings['base_concentration']} ppm\n",
+                    f"Input Gas Concentration: {settings['input_concentration']} ppm\n",
+                    f"Total Flow: {settings['total_flow']} {settings['flow_unit']}\n",
+                    f"Step Duration: {settings['step_duration']} {settings['duration_unit']}\n",
+                    f"Back and Forth: {'Yes' if settings['back_forth'] else 'No'}\n",
+                    f"\n=== Steps ({len(self.computed_steps)} total) ===\n\n",
+                ]
+                parts.extend(f"Step {i}: {step:.2f} ppm\n" for i, step in enumerate(self.computed_steps, 1))
+                # Build the whole file first and write it in one call
                 with open(filename, 'w') as f:
-                    f.write("=== Calibration Routine Configuration ===\n\n")
-                    f.write(f"Data Directory: {self.directory_var.get()}\n")
-                    f.write(f"Base Gas Concentration: {self.base_concentration_var.get()} ppm\n")
-                    f.write(f"Input Gas Concentration: {self.input_concentration_var.get()} ppm\n")
-                    f.write(f"Total Flow: {self.total_flow_var.get()} {self.flow_unit_var.get()}\n")
-                    f.write(f"Step Duration: {self.step_duration_var.get()} {self.duration_unit_var.get()}\n")
-                    f.write(f"Back and Forth: {'Yes' if self.back_forth_var.get() else 'No'}\n")
-                    f.write(f"\n=== Steps ({len(self.computed_steps)} total) ===\n\n")
-                    for i, step in enumerate(self.computed_steps, 1):
-                        f.write(f"Step {i}: {step:.2f} ppm\n")
+                    f.write(''.join(parts))
                         
                 messagebox.showinfo("Success", f"Configuration exported to:\n{filename}")
             except Exception as e:
@@ -925,23 +1213,22 @@ class ManualStepDialog(tk.Toplevel):
         
     def on_ok(self):
         """Parse the entered steps and close dialog"""
-        text_content = self.text_widget.get("1.0", tk.END)
-        lines = text_content.strip().split('\n')
-        
-        steps = []
-        errors = []
+        lines = self.text_widget.get("1.0", tk.END).splitlines()
         
-        for i, line in enumerate(lines, 1):
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                value = float(line)
-                steps.append(value)
-            except ValueError:
-                errors.append(f"Line {i}: '{line}' is not a valid number")
-        
-        if errors:
+        try:
+            # float() ignores surrounding whitespace, so valid input converts in one pass
+            steps = list(map(float, filter(str.strip, lines)))
+        except ValueError:
+            # Go line by line only to tell the user which lines are wrong
+            errors = []
+            for i, line in enumerate(lines, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    float(line)
+                except ValueError:
+                    errors.append(f"Line {i}: '{line}' is not a valid number")
             messagebox.showerror("Invalid Input", "\n".join(errors))
             return
             
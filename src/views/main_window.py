@@ -1,8 +1,12 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-from typing import Dict, Any
-from threading import Thread
+from typing import Dict, Any, List, Tuple
+from collections import deque
+from functools import lru_cache
+from threading import Event, Thread
+import time
 from datetime import datetime
+from dateutil.tz import tzlocal
 from ..models.data_logger import DataLogger
 from ..models.calculations import calculate_real_outflow
 from ..models.uncertainty import (
@@ -11,11 +15,10 @@ from ..models.uncertainty import (
     convert_flow_to_mln_min,
     format_uncertainty_string
 )
-import matplotlib.dates as mdates
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+# matplotlib is imported where the plots are built, so a window without
+# plots (is_raspberry) doesn't pay for it at startup
 import numpy as np
-from .calibration_window import CalibrationWindow
+from .calibration_window import CalibrationWindow, init_styles
 
 KNOWN_FLOW_RANGES = {
     8: (0.13604, 10, "mln/min"),
@@ -46,6 +49,53 @@ INSTRUMENT_NAMES = {
 # Display order from top to bottom
 INSTRUMENT_DISPLAY_ORDER = [20, 3, 5, 8, 10]
 
+# Number of samples (one per second) kept for the live plots
+PLOT_MAX_POINTS = 300
+
+# The live time axis jumps ahead in steps of this many seconds instead of
+# moving every tick, so most updates can blit over the cached background
+PLOT_X_STEP = 30.0
+# Y limits are padded by this fraction of the data range when they change
+PLOT_Y_MARGIN = 0.05
+
+# Plot times are stored as matplotlib date numbers and shown in local time
+# (the system zone, so DST changes during a session are followed)
+LOCAL_TZ = tzlocal()
+SECONDS_PER_DAY = 86400.0  # Matplotlib date numbers are days since 1970-01-01
+
+
+@lru_cache(maxsize=256)
+def _clock_label(seconds: int) -> str:
+    """Local HH:MM:SS label of a Unix time; tick times repeat across redraws.
+
+    Pure function of the timestamp (the system zone's offset for that instant),
+    so cached labels stay correct across DST changes.
+    """
+    return datetime.fromtimestamp(seconds).strftime('%H:%M:%S')
+
+
+# Command output log: icon per message type, batching delay and retained lines
+LOG_ICONS = {
+    'info': 'ℹ️',
+    'success': '✓',
+    'warning': '⚠️',
+    'error': '✗'
+}
+LOG_FLUSH_MS = 100
+
+# Readings shown on each instrument card, with their display format, unit
+# (None: the instrument's flow unit) and icon
+READING_PARAMS = ('Flow', 'Valve', 'Temperature')
+READING_FORMATS = ('{:.3f}', '{:.1f}', '{:.1f}')
+READING_UNITS = (None, '%', '°C')
+READING_ICONS = ('💨', '🔧', '🌡️')
+
+# Delay used to coalesce bursts of <Configure> events while resizing
+CONFIGURE_DEBOUNCE_MS = 50
+
+# Serial ports offered in the connection panel
+COM_PORTS = tuple(f"COM{i}" for i in range(1, 25))
+
 # Safety warning shown when stopping one or more MFCs or setting flow to 0.
 STOP_MFCS_WARNING_MESSAGE = (
     "Are you sure you want to stop the MFCs ? "
@@ -58,6 +108,8 @@ class MainWindow(tk.Frame):
         self.parent = parent
         self.controller = controller
         self.settings = settings
+        # Verbose diagnostics in the log (off for normal runs)
+        self._debug = bool(self.settings.get('debug', False))
         
         # The application will only run on Windows, so is_raspberry can be set to False
         self.is_raspberry = False
@@ -97,85 +149,13 @@ class MainWindow(tk.Frame):
         
         # Configure modern styling with better fonts and spacing
         self.style = ttk.Style()
-        self.style.theme_use('clam')  # More modern base theme
+        self._configure_styles()
         
         # Main background
         self.configure(bg=self.colors['background'])
         
-        # Labels - modern sans-serif font
-        self.style.configure('TLabel', 
-                           font=('Segoe UI', 11),
-                           background=self.colors['background'],
-                           foreground=self.colors['text'])
-        
-        # Buttons - modern flat design with rounded appearance
-        self.style.configure('TButton', 
-                           font=('Segoe UI', 11, 'bold'),
-                           padding=(12, 8),
-                           borderwidth=0,
-                           focuscolor='none',
-                           background=self.colors['secondary'])
-        self.style.map('TButton',
-                      background=[('active', self.colors['primary']),
-                                ('pressed', '#2980B9')])
-        
-        # Primary action button style
-        self.style.configure('Primary.TButton',
-                           font=('Segoe UI', 11, 'bold'),
-                           padding=(15, 10),
-                           background=self.colors['secondary'])
-        
-        # Success button style (for start/apply actions)
-        self.style.configure('Success.TButton',
-                           font=('Segoe UI', 11, 'bold'),
-                           padding=(12, 8),
-                           background=self.colors['success'])
-        
-        # Warning button style (for stop actions)
-        self.style.configure('Warning.TButton',
-                           font=('Segoe UI', 11, 'bold'),
-                           padding=(12, 8),
-                           background=self.colors['accent'])
-        
-        # Entry fields - clean modern look
-        self.style.configure('TEntry', 
-                           font=('Segoe UI', 11),
-                           fieldbackground=self.colors['card'],
-                           borderwidth=2,
-                           relief='flat')
-        
-        # LabelFrame - modern card-like appearance
-        self.style.configure('TLabelframe', 
-                           font=('Segoe UI', 12, 'bold'),
-                           background=self.colors['background'],
-                           foreground=self.colors['primary'],
-                           borderwidth=2,
-                           relief='groove')
-        self.style.configure('TLabelframe.Label',
-                           font=('Segoe UI', 12, 'bold'),
-                           background=self.colors['background'],
-                           foreground=self.colors['primary'])
-        
-        # Card-style frame for instruments
-        self.style.configure('Card.TFrame',
-                           background=self.colors['card'],
-                           relief='raised',
-                           borderwidth=1)
-        
-        # Regular frame style (white background for scrollable areas)
-        self.style.configure('TFrame',
-                           background=self.colors['card'])
-        
-        # Combobox styling
-        self.style.configure('TCombobox',
-                           font=('Segoe UI', 11),
-                           fieldbackground=self.colors['card'],
-                           background=self.colors['card'],
-                           borderwidth=2)
-        
-        # Separator
-        self.style.configure('TSeparator',
-                           background=self.colors['border'])
+        # Application-wide tweaks shared with the calibration window (applied once)
+        init_styles(self.parent)
         
         # Configure grid weights
         self.parent.grid_rowconfigure(0, weight=1)
@@ -189,6 +169,11 @@ class MainWindow(tk.Frame):
             'C1_ppm': tk.DoubleVar(value=0),
             'C2_ppm': tk.DoubleVar(value=4980)
         }
+        # Plain-float copies of the concentrations for the per-tick code, kept
+        # current by write traces so ticks do not go through Tcl
+        self._conc_values = {key: var.get() for key, var in self.variables.items()}
+        for key, var in self.variables.items():
+            var.trace_add('write', lambda *args, key=key: self._on_concentration_changed(key))
         
         # Flag to track if instrument scanning has been completed
         self.instruments_scanned = False
@@ -207,12 +192,8 @@ class MainWindow(tk.Frame):
         # Configure fonts based on platform settings
         self.default_font = (self.settings['font_family'], self.settings['font_size'])
 
-        # Initialize plot data
-        self.times = []
-        self.flow1_data = {'sp': [], 'pv': []}
-        self.flow2_data = {'sp': [], 'pv': []}
-        self.conc_data = {'target': [], 'actual': [], 'theoretical': []}  # theoretical from setpoints
-        self.uncertainty_data = []  # Store uncertainty values for plotting
+        # Initialize plot data (fixed-size ring buffers, see _reset_plot_buffers)
+        self._reset_plot_buffers()
 
         # Plot options / realtime numeric display
         self.show_theoretical_var = tk.BooleanVar(value=True)
@@ -228,6 +209,16 @@ class MainWindow(tk.Frame):
         
         # Initialize a dict to hold the flow entry widgets for each instrument
         self.flow_entries = {}
+        # Instrument cards kept across rescans, plus their range labels
+        self._instrument_frames: Dict[int, ttk.Frame] = {}
+        self._range_labels: Dict[int, ttk.Label] = {}
+        # Factor converting each instrument's flow reading to ln/min, set at scan time
+        self._flow_scale: Dict[int, float] = {}
+        # Flat (address, value labels in READING_PARAMS order) list for update_readings
+        self._reading_widgets: List[Tuple[int, Tuple[tk.Label, ...]]] = []
+        # Text last written to each value label, so unchanged values skip the Tk call
+        self._reading_texts: Dict[tk.Label, str] = {}
+        self._no_instruments_label = None
         
         # Setup UI components - make sure this is called after is_raspberry is set
         self.setup_gui()
@@ -247,6 +238,10 @@ class MainWindow(tk.Frame):
         )
         output_header.grid(row=0, column=0, sticky="w", padx=10, pady=(8, 0))
         
+        # Messages waiting to be written by _flush_command_output
+        self._log_buffer = deque()
+        self._log_flush_scheduled = False
+
         self.command_output = tk.Text(
             output_frame, 
             height=8, 
@@ -286,6 +281,9 @@ class MainWindow(tk.Frame):
 
     def print_to_command_output(self, message: str, msg_type: str = 'info'):
         """Prints a message to the command output text widget with color coding.
+
+        Messages are queued and written to the widget in batches by
+        _flush_command_output, so a burst of messages costs one widget update.
         
         Args:
             message: The message to display
@@ -294,28 +292,114 @@ class MainWindow(tk.Frame):
         now = datetime.now().strftime("%H:%M:%S")
         
         # Choose icon based on message type
-        icons = {
-            'info': 'ℹ️',
-            'success': '✓',
-            'warning': '⚠️',
-            'error': '✗'
-        }
-        icon = icons.get(msg_type, 'ℹ️')
+        icon = LOG_ICONS.get(msg_type, 'ℹ️')
         
         if hasattr(self, 'command_output'):
-            self.command_output.config(state='normal')
-            
-            # Insert timestamp with gray color
-            self.command_output.insert(tk.END, f"[{now}] ", 'timestamp')
-            
-            # Insert icon and message with appropriate color
-            self.command_output.insert(tk.END, f"{icon} {message}\n", msg_type)
-            
-            self.command_output.config(state='disabled')
-            self.command_output.see(tk.END) # Scroll to the end
+            # Timestamp in gray, then icon and message with the type's color
+            self._log_buffer.append((f"[{now}] ", 'timestamp', f"{icon} {message}\n", msg_type))
+            if not self._log_flush_scheduled:
+                self._log_flush_scheduled = True
+                self.after(LOG_FLUSH_MS, self._flush_command_output)
         else:
             print(f"[{now}] {icon} {message}") # Fallback to console if text widget not ready
 
+    def _flush_command_output(self):
+        """Write all queued log messages to the command output in one insert"""
+        self._log_flush_scheduled = False
+        chunks = []
+        while self._log_buffer:
+            chunks.extend(self._log_buffer.popleft())
+        if not chunks:
+            return
+
+        self.command_output.config(state='normal')
+        self.command_output.insert(tk.END, *chunks)
+        self.command_output.config(state='disabled')
+        self.command_output.see(tk.END) # Scroll to the end
+
+    def _configure_styles(self):
+        """Configure the application ttk styles, once per Tk root."""
+        if getattr(self.parent, '_main_styles_inited', False):
+            return
+        self.style.theme_use('clam')  # More modern base theme
+        
+        # Labels - modern sans-serif font
+        self.style.configure('TLabel', 
+                           font=('Segoe UI', 11),
+                           background=self.colors['background'],
+                           foreground=self.colors['text'])
+        
+        # Buttons - modern flat design with rounded appearance
+        self.style.configure('TButton', 
+                           font=('Segoe UI', 11, 'bold'),
+                           padding=(12, 8),
+                           borderwidth=0,
+                           focuscolor='none',
+                           background=self.colors['secondary'])
+        self.style.map('TButton',
+                      background=[('active', self.colors['primary']),
+                                ('pressed', '#2980B9')])
+        
+        # Primary action button style
+        self.style.configure('Primary.TButton',
+                           font=('Segoe UI', 11, 'bold'),
+                           padding=(15, 10),
+                           background=self.colors['secondary'])
+        
+        # Success button style (for start/apply actions)
+        self.style.configure('Success.TButton',
+                           font=('Segoe UI', 11, 'bold'),
+                           padding=(12, 8),
+                           background=self.colors['success'])
+        
+        # Warning button style (for stop actions)
+        self.style.configure('Warning.TButton',
+                           font=('Segoe UI', 11, 'bold'),
+                           padding=(12, 8),
+                           background=self.colors['accent'])
+        
+        # Entry fields - clean modern look
+        self.style.configure('TEntry', 
+                           font=('Segoe UI', 11),
+                           fieldbackground=self.colors['card'],
+                           borderwidth=2,
+                           relief='flat')
+        
+        # LabelFrame - modern card-like appearance
+        self.style.configure('TLabelframe', 
+                           font=('Segoe UI', 12, 'bold'),
+                           background=self.colors['background'],
+                           foreground=self.colors['primary'],
+                           borderwidth=2,
+                           relief='groove')
+        self.style.configure('TLabelframe.Label',
+                           font=('Segoe UI', 12, 'bold'),
+                           background=self.colors['background'],
+                           foreground=self.colors['primary'])
+        
+        # Card-style frame for instruments
+        self.style.configure('Card.TFrame',
+                           background=self.colors['card'],
+                           relief='raised',
+                           borderwidth=1)
+        
+        # Regular frame style (white background for scrollable areas)
+        self.style.configure('TFrame',
+                           background=self.colors['card'])
+        
+        # Combobox styling
+        self.style.configure('TCombobox',
+                           font=('Segoe UI', 11),
+                           fieldbackground=self.colors['card'],
+                           background=self.colors['card'],
+                           borderwidth=2)
+        
+        # Separator
+        self.style.configure('TSeparator',
+                           background=self.colors['border'])
+
+        self.parent._main_styles_inited = True
+
     def setup_gui(self):
         # Use a modern frame as the main container with background color
         self.main_container = ttk.Frame(self, padding="15")
@@ -441,6 +525,7 @@ class MainWindow(tk.Frame):
         # Create plots in the right panel
         if not self.is_raspberry:
             self.fig, self.ax1, self.ax2, self.ax3, self.canvas = self.create_plot_canvas(plot_frame)
+            self._init_live_plots()
 
     def setup_connection_panel(self, parent):
         """Sets up the panel for COM port selection and scanning with modern styling."""
@@ -460,11 +545,10 @@ class MainWindow(tk.Frame):
         com_port_label.pack(side=tk.LEFT, padx=(0, 8))
 
         self.com_port_var = tk.StringVar()
-        ports = [f"COM{i}" for i in range(1, 25)]
         self.com_port_dropdown = ttk.Combobox(
             port_frame,
             textvariable=self.com_port_var,
-            values=ports,
+            values=COM_PORTS,
             state="readonly",
             width=12,
             font=('Segoe UI', 10)
@@ -699,17 +783,28 @@ class MainWindow(tk.Frame):
         self.scan_button.config(state="disabled")
         
         def scan_thread():
+            result = {'ok': True, 'found': None, 'err': None}
             try:
-                found_instruments = self.controller.scan_for_instruments()
-                self.after(0, lambda: self.print_to_command_output(f"Found instruments at addresses: {found_instruments}", 'success'))
-                self.after(0, self.update_ui_with_scan_results, found_instruments)
+                result['found'] = self.controller.scan_for_instruments()
             except Exception as e:
-                self.after(0, lambda: self.print_to_command_output(f"Scan failed: {e}", 'error'))
-            finally:
-                self.after(0, lambda: self.scan_button.config(state="normal"))
+                result['ok'] = False
+                result['err'] = str(e)
+            # Hand everything back to the Tk thread in a single event
+            self.after(0, self._apply_scan_result, result)
 
         Thread(target=scan_thread, daemon=True).start()
 
+    def _apply_scan_result(self, result: Dict[str, Any]):
+        """Report a finished scan and refresh the instrument panel (Tk thread)."""
+        try:
+            if result['ok']:
+                self.print_to_command_output(f"Found instruments at addresses: {result['found']}", 'success')
+                self.update_ui_with_scan_results(result['found'])
+            else:
+                self.print_to_command_output(f"Scan failed: {result['err']}", 'error')
+        finally:
+            self.scan_button.config(state="normal")
+
     def open_calibration_window(self):
         """Open the calibration routine window"""
         try:
@@ -730,13 +825,16 @@ class MainWindow(tk.Frame):
 
     def update_ui_with_scan_results(self, found_instruments):
         """Update UI after scanning is complete. ONLY updates the scrollable frame."""
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
+        if self._no_instruments_label is not None:
+            self._no_instruments_label.destroy()
+            self._no_instruments_label = None
 
         if not self.controller.is_connected() or not found_instruments:
+            self._remove_instrument_controls(list(self._instrument_frames))
             self.print_to_command_output("No instruments found or connection failed.", 'warning')
             self.update_status("Scan complete. No instruments found.", "orange")
-            ttk.Label(self.scrollable_frame, text="No instruments found.").pack(pady=20)
+            self._no_instruments_label = ttk.Label(self.scrollable_frame, text="No instruments found.")
+            self._no_instruments_label.pack(pady=20)
             return
 
         instruments_metadata = self.controller.get_instrument_metadata()
@@ -777,17 +875,31 @@ class MainWindow(tk.Frame):
                     break
             self.print_to_command_output(f"Variable gas set to Automatic mode (will select best instrument based on flow)", 'info')
         
-        # Display instruments in the specified order
-        for addr in INSTRUMENT_DISPLAY_ORDER:
-            if addr in instruments_metadata:
-                metadata = instruments_metadata[addr]
-                self.setup_instrument_controls(self.scrollable_frame, addr, metadata)
-        
-        # Display any additional instruments not in the predefined order
-        for addr in sorted(instruments_metadata.keys()):
-            if addr not in INSTRUMENT_DISPLAY_ORDER:
-                metadata = instruments_metadata[addr]
-                self.setup_instrument_controls(self.scrollable_frame, addr, metadata)
+        # Only build cards for new instruments; a rescan of the same set
+        # keeps every existing widget and just refreshes the range text
+        new_addrs = set(instruments_metadata)
+        old_addrs = set(self._instrument_frames)
+        self._remove_instrument_controls(old_addrs - new_addrs)
+        for addr in old_addrs & new_addrs:
+            self._range_labels[addr].config(text=self._range_text(instruments_metadata[addr]))
+        added = new_addrs - old_addrs
+        for addr in added:
+            self.setup_instrument_controls(self.scrollable_frame, addr, instruments_metadata[addr])
+
+        # Instruments in the specified order, then any others by address
+        if added:
+            order = [addr for addr in INSTRUMENT_DISPLAY_ORDER if addr in new_addrs]
+            order += sorted(addr for addr in new_addrs if addr not in INSTRUMENT_DISPLAY_ORDER)
+            for addr in order:
+                self._instrument_frames[addr].pack_forget()
+            for addr in order:
+                self._instrument_frames[addr].pack(fill=tk.X, expand=True, pady=8, padx=5)
+
+        # Units don't change during a session, so decide the ml -> l scaling once
+        self._flow_scale = {
+            addr: 0.001 if self.controller.read_unit(addr) in ("ml/min", "mln/min") else 1.0
+            for addr in instruments_metadata
+        }
             
         self.update_status(f"Scan complete. Found {len(instruments_metadata)} instruments.", "green")
         self.instruments_scanned = True
@@ -844,16 +956,57 @@ class MainWindow(tk.Frame):
 
         canvas_window = canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
 
+        # <Configure> fires continuously while the window is dragged; only apply
+        # the last event of a burst (pending after() ids per handler)
+        pending = {'frame': None, 'canvas': None}
+
+        def debounce(key, callback):
+            if pending[key] is not None:
+                self.after_cancel(pending[key])
+            pending[key] = self.after(CONFIGURE_DEBOUNCE_MS, run_pending, key, callback)
+
+        def run_pending(key, callback):
+            pending[key] = None
+            callback()
+
         def on_frame_configure(event):
-            canvas.configure(scrollregion=canvas.bbox("all"))
+            debounce('frame', lambda: canvas.configure(scrollregion=canvas.bbox("all")))
 
         def on_canvas_configure(event):
             # When canvas is resized, update the width of the scrollable frame
-            canvas.itemconfig(canvas_window, width=event.width)
+            debounce('canvas', lambda width=event.width: canvas.itemconfig(canvas_window, width=width))
 
         self.scrollable_frame.bind("<Configure>", on_frame_configure)
         canvas.bind("<Configure>", on_canvas_configure)
 
+    def _remove_instrument_controls(self, addresses):
+        """Destroy the cards of instruments that are no longer present."""
+        for addr in addresses:
+            self._instrument_frames.pop(addr).destroy()
+            self._range_labels.pop(addr, None)
+            self.flow_entries.pop(addr, None)
+            self.reading_labels.pop(addr, None)
+        self._rebuild_reading_widgets()
+
+    def _rebuild_reading_widgets(self):
+        """Refresh the flat list of value labels walked by update_readings."""
+        self._reading_widgets = [
+            (addr, tuple(labels[param] for param in READING_PARAMS))
+            for addr, labels in self.reading_labels.items()
+        ]
+        self._reading_texts = {
+            label: self._reading_texts.get(label, "---")
+            for _, labels in self._reading_widgets for label in labels
+        }
+
+    @staticmethod
+    def _range_text(metadata: Dict[str, Any]) -> str:
+        """Format the min/max flow range shown on an instrument card."""
+        min_flow = metadata.get('min_flow', 0.0)
+        max_flow = metadata.get('max_flow', 0.0)
+        unit = metadata.get('unit', 'ln/min')
+        return f"{min_flow:.4f} - {max_flow:.2f} {unit}"
+
     def setup_instrument_controls(self, parent: ttk.Frame, addr: int, metadata: Dict[str, Any] = None):
         """Setup controls for a single instrument with modern card-style design."""
         if metadata is None:
@@ -894,8 +1047,6 @@ class MainWindow(tk.Frame):
         content_frame.pack(fill=tk.X, expand=True, padx=12, pady=(0, 10))
         
         # Display min/max flow range with modern badge style
-        min_flow = metadata.get('min_flow', 0.0)
-        max_flow = metadata.get('max_flow', 0.0)
         unit = metadata.get('unit', 'ln/min')
         
         range_frame = ttk.Frame(content_frame)
@@ -908,12 +1059,15 @@ class MainWindow(tk.Frame):
             foreground=self.colors['text']
         ).pack(side=tk.LEFT, padx=(0, 5))
         
-        ttk.Label(
+        range_label = ttk.Label(
             range_frame, 
-            text=f"{min_flow:.4f} - {max_flow:.2f} {unit}",
+            text=self._range_text(metadata),
             font=('Segoe UI', 9),
             foreground=self.colors['secondary']
-        ).pack(side=tk.LEFT)
+        )
+        range_label.pack(side=tk.LEFT)
+        self._instrument_frames[addr] = instrument_outer
+        self._range_labels[addr] = range_label
         
         # Flow setter with modern layout
         setter_frame = ttk.Frame(content_frame)
@@ -962,13 +1116,7 @@ class MainWindow(tk.Frame):
         readings_frame = ttk.Frame(content_frame)
         readings_frame.grid(row=2, column=0, columnspan=5, sticky='ew')
         
-        params = [
-            ('Flow', unit, '💨'),
-            ('Valve', '%', '🔧'),
-            ('Temperature', '°C', '🌡️')
-        ]
-        
-        for i, (param, param_unit, icon) in enumerate(params):
+        for param, param_unit, icon in zip(READING_PARAMS, READING_UNITS, READING_ICONS):
             param_frame = ttk.Frame(readings_frame)
             param_frame.pack(fill=tk.X, pady=4)
             
@@ -1002,13 +1150,14 @@ class MainWindow(tk.Frame):
             # Unit label
             ttk.Label(
                 param_frame, 
-                text=param_unit,
+                text=param_unit or unit,
                 font=('Segoe UI', 9),
                 foreground=self.colors['text'],
                 width=8
             ).pack(side=tk.LEFT)
             
             self.reading_labels[addr][param] = value_label
+        self._rebuild_reading_widgets()
 
     def set_manual_flow(self, address: int):
         """Set the flow for an instrument from its manual entry field."""
@@ -1067,13 +1216,14 @@ class MainWindow(tk.Frame):
         except Exception as e:
             self.print_to_command_output(f"Error setting flow for address {address}: {e}", 'error')
     
-    def select_best_instrument_for_flow(self, required_flow: float) -> int:
+    def select_best_instrument_for_flow(self, required_flow: float, quiet: bool = False) -> int:
         """
         Select the best instrument for the required flow based on available instruments.
         The instrument should be able to handle the flow at its maximum capacity.
         
         Args:
             required_flow: The required flow in ln/min
+            quiet: Log nothing, for callers that plan many flows at once
             
         Returns:
             The address of the best instrument, or None if no suitable instrument found
@@ -1083,10 +1233,13 @@ class MainWindow(tk.Frame):
         
         # Get all available instruments (excluding base gas at address 20)
         instruments_metadata = self.controller.get_instrument_metadata()
+        # Step-by-step diagnostics only in debug mode
+        debug = self._debug and not quiet
         
-        self.print_to_command_output(
-            f"[DEBUG] Selecting instrument for flow {required_flow:.6f} L/min", 'info'
-        )
+        if debug:
+            self.print_to_command_output(
+                f"[DEBUG] Selecting instrument for flow {required_flow:.6f} L/min", 'info'
+            )
         
         # Build a list of candidate instruments with their ranges
         candidates = []
@@ -1098,32 +1251,36 @@ class MainWindow(tk.Frame):
             min_flow = metadata.get('min_flow', 0)
             unit = metadata.get('unit', 'ln/min')
             
-            self.print_to_command_output(
-                f"[DEBUG]   Addr {addr}: range {min_flow:.4f}-{max_flow:.4f} {unit}", 'info'
-            )
+            if debug:
+                self.print_to_command_output(
+                    f"[DEBUG]   Addr {addr}: range {min_flow:.4f}-{max_flow:.4f} {unit}", 'info'
+                )
             
             # Convert flow ranges to L/min for consistent comparison
             # Units can be: 'ml/min', 'mln/min', 'ln/min', 'l/min'
             if 'ml' in unit.lower() or 'mln' in unit.lower():
                 max_flow_lmin = max_flow / 1000  # Convert ml/min to L/min
                 min_flow_lmin = min_flow / 1000
-                self.print_to_command_output(
-                    f"[DEBUG]     → Converted: {min_flow_lmin:.6f}-{max_flow_lmin:.6f} L/min", 'info'
-                )
+                if debug:
+                    self.print_to_command_output(
+                        f"[DEBUG]     → Converted: {min_flow_lmin:.6f}-{max_flow_lmin:.6f} L/min", 'info'
+                    )
             else:
                 max_flow_lmin = max_flow  # Already in L/min
                 min_flow_lmin = min_flow
-                self.print_to_command_output(
-                    f"[DEBUG]     → Already in L/min: {min_flow_lmin:.6f}-{max_flow_lmin:.6f} L/min", 'info'
-                )
+                if debug:
+                    self.print_to_command_output(
+                        f"[DEBUG]     → Already in L/min: {min_flow_lmin:.6f}-{max_flow_lmin:.6f} L/min", 'info'
+                    )
             
             # Check if the instrument can handle this flow (using converted values)
             if min_flow_lmin <= required_flow <= max_flow_lmin:
                 # Calculate utilization percentage
                 utilization = (required_flow / max_flow_lmin) * 100 if max_flow_lmin > 0 else 0
-                self.print_to_command_output(
-                    f"[DEBUG]     ✓ Can handle flow (utilization: {utilization:.1f}%)", 'info'
-                )
+                if debug:
+                    self.print_to_command_output(
+                        f"[DEBUG]     ✓ Can handle flow (utilization: {utilization:.1f}%)", 'info'
+                    )
                 candidates.append({
                     'address': addr,
                     'max_flow': max_flow_lmin,  # Store converted value for sorting
@@ -1132,14 +1289,16 @@ class MainWindow(tk.Frame):
                     'name': INSTRUMENT_NAMES.get(addr, f"Address {addr}")
                 })
             else:
-                self.print_to_command_output(
-                    f"[DEBUG]     ✗ Cannot handle flow (required={required_flow:.6f}, range={min_flow_lmin:.6f}-{max_flow_lmin:.6f} L/min)", 'info'
-                )
+                if debug:
+                    self.print_to_command_output(
+                        f"[DEBUG]     ✗ Cannot handle flow (required={required_flow:.6f}, range={min_flow_lmin:.6f}-{max_flow_lmin:.6f} L/min)", 'info'
+                    )
         
         if not candidates:
-            self.print_to_command_output(
-                f"[DEBUG]   No suitable instrument found!", 'warning'
-            )
+            if debug:
+                self.print_to_command_output(
+                    f"[DEBUG]   No suitable instrument found!", 'warning'
+                )
             return None
         
         # Sort by utilization percentage (descending) - highest utilization = best accuracy
@@ -1149,15 +1308,17 @@ class MainWindow(tk.Frame):
         # Select the best candidate (highest utilization)
         best = candidates[0]
         
-        self.print_to_command_output(
-            f"[DEBUG]   Selected: {best['name']} (addr {best['address']}, utilization: {best['utilization']:.1f}%)", 'success'
-        )
-        self.print_to_command_output(
-            f"Flow {required_flow:.3f} ln/min → {best['name']} "
-            f"(range: {best['min_flow']:.4f}-{best['max_flow']:.2f} ln/min, "
-            f"utilization: {best['utilization']:.1f}%)", 
-            'info'
-        )
+        if debug:
+            self.print_to_command_output(
+                f"[DEBUG]   Selected: {best['name']} (addr {best['address']}, utilization: {best['utilization']:.1f}%)", 'success'
+            )
+        if not quiet:
+            self.print_to_command_output(
+                f"Flow {required_flow:.3f} ln/min → {best['name']} "
+                f"(range: {best['min_flow']:.4f}-{best['max_flow']:.2f} ln/min, "
+                f"utilization: {best['utilization']:.1f}%)", 
+                'info'
+            )
         
         return best['address']
 
@@ -1168,19 +1329,16 @@ class MainWindow(tk.Frame):
             return
 
         try:
-            # Get values with validation
-            values = {}
-            for key in ['C_tot_ppm', 'C1_ppm', 'C2_ppm']:
-                try:
-                    value = self.variables[key].get()
-                    if value == "":
-                        raise ValueError(f"{key} cannot be empty")
-                    values[key] = float(value)
-                except (ValueError, tk.TclError) as e:
-                    msg = f"Invalid input for {key}"
-                    self.update_status(msg, "red")
-                    self.print_to_command_output(msg, 'error')
-                    return
+            # Get values with validation (an empty or non-numeric field raises TclError)
+            try:
+                values = {key: float(self.variables[key].get()) for key in ('C_tot_ppm', 'C1_ppm', 'C2_ppm')}
+                if not np.isfinite(list(values.values())).all():
+                    raise ValueError("concentrations must be finite numbers")
+            except (ValueError, tk.TclError) as e:
+                msg = f"Invalid input: {e}"
+                self.update_status(msg, "red")
+                self.print_to_command_output(msg, 'error')
+                return
 
             # Get max flow value from the GUI
             try:
@@ -1198,12 +1356,15 @@ class MainWindow(tk.Frame):
             )
             
             # Debug the returned values to understand what we're getting
-            self.print_to_command_output(f"Debug - Returned flow values: Q1={Q1}, Q2={Q2}")
+            # (collected and written to the log as one message)
+            lines = []
+            if self._debug:
+                lines.append(f"Debug - Returned flow values: Q1={Q1}, Q2={Q2}")
             
             # Check if we got actual flow values or addresses
             if not isinstance(Q1, (float, int)) or not isinstance(Q2, (float, int)):
                 # If controller returned non-numeric values, calculate flows locally
-                self.print_to_command_output("Controller didn't return numeric flows. Calculating locally...")
+                lines.append("Controller didn't return numeric flows. Calculating locally...")
                 from ..models.calculations import calculate_flows_variable
                 Q1, Q2 = calculate_flows_variable(
                     values['C_tot_ppm'],
@@ -1211,7 +1372,9 @@ class MainWindow(tk.Frame):
                     values['C2_ppm'],
                     max_flow
                 )
-                self.print_to_command_output(f"Locally calculated flows: Q1={Q1:.3f}, Q2={Q2:.3f}")
+                lines.append(f"Locally calculated flows: Q1={Q1:.3f}, Q2={Q2:.3f}")
+            if lines:
+                self.print_to_command_output("\n".join(lines))
             
             # Map to instrument addresses
             addr1 = self.instrument_addresses.get('gas1')  # Base gas (air) - always 20
@@ -1239,6 +1402,8 @@ class MainWindow(tk.Frame):
                 self.current_gas2_address = addr2
             
             flows = {addr1: Q1, addr2: Q2}
+            # Units of the two active instruments, used for both the entries and the message
+            units = {addr: self.controller.read_unit(addr) for addr in flows}
 
             # Clear all other flow entries so it's obvious which instruments are active
             for addr, entry_widget in self.flow_entries.items():
@@ -1252,8 +1417,7 @@ class MainWindow(tk.Frame):
             # Pre-fill the flow entry fields with calculated values
             for addr, flow in flows.items():
                 if addr in self.flow_entries:
-                    # Get the unit from controller
-                    unit = self.controller.read_unit(addr)
+                    unit = units[addr]
                     
                     # Convert flow value based on unit if needed
                     converted_flow = flow
@@ -1271,7 +1435,7 @@ class MainWindow(tk.Frame):
             for addr, flow in flows.items():
                 # Get instrument name and unit
                 instrument_name = INSTRUMENT_NAMES.get(addr, f"Address {addr}")
-                unit = self.controller.read_unit(addr)
+                unit = units[addr]
                 
                 # Convert flow value based on unit if needed
                 converted_flow = flow
@@ -1305,10 +1469,7 @@ class MainWindow(tk.Frame):
                 
                 self.print_to_command_output(
                     f"Expected uncertainty: ±{u_details['u_C']:.2f} ppm "
-                    f"({u_details['relative_error']:.2f}% of target)", 
-                    'info'
-                )
-                self.print_to_command_output(
+                    f"({u_details['relative_error']:.2f}% of target)\n"
                     f"Flow uncertainties: Base gas ±{u_details['u_F1']:.3f} mln/min, "
                     f"Variable gas ±{u_details['u_F2']:.3f} mln/min", 
                     'info'
@@ -1327,31 +1488,101 @@ class MainWindow(tk.Frame):
     def start_updates(self):
         """Start periodic updates of instrument readings and plots"""
         self.update_counter = 0  # Add a counter for controlling plot update frequency
+        # Seconds between readings; platforms may override
+        self._tick_period = self.settings.get('update_period', 1.0)
+        # Plots refresh every _plot_skip ticks; readings are still collected every tick
+        self._plot_skip = max(1, int(self.settings.get('plot_skip', 2)))
+        self._next_tick = time.monotonic()
+
+        # Instrument reads run on their own thread; the Tk loop below only
+        # consumes the latest readings it published
+        self._latest_readings = {}
+        # (pass number, wall time) of the last published pass; collect_plot_data
+        # appends one sample per pass, so a stalled reader adds no repeats
+        self._latest_pass = (0, None)
+        self._plotted_pass = 0
+        self._reader_errors = deque()  # Filled by the reader thread, logged by update()
+        self._reader_stop = Event()
+        Thread(target=self._reader_loop, daemon=True).start()
         
         def update():
+            # A tick that Tk ran more than a period late skips its plot refresh
+            # instead of adding more drawing to an already busy event loop
+            late = time.monotonic() - self._next_tick > self._tick_period
             try:
                 self.update_counter += 1
+
+                # Report reader thread failures on the Tk thread
+                while self._reader_errors:
+                    self.print_to_command_output(self._reader_errors.popleft(), 'error')
                 
-                # Always update readings (every second)
+                # Always update readings (every tick)
                 self.update_readings()
                 
-                # Collect data for plots (every second)
+                # Collect data for plots (every tick)
                 self.collect_plot_data()
                 
-                # Update plots less frequently to improve performance (every 2 seconds)
-                if not self.is_raspberry and self.update_counter % 2 == 0:
+                # Update plots less frequently to improve performance (every _plot_skip ticks)
+                redraw = not late and self.update_counter % self._plot_skip == 0
+                if redraw and not self.is_raspberry:
                     self.update_plots()
                     
-                # Update popup graphs if window is open (every 2 seconds)
-                if hasattr(self, 'graph_window_open') and self.graph_window_open and self.update_counter % 2 == 0:
+                # Update popup graphs if window is open and not minimized (same cadence)
+                if (redraw and getattr(self, 'graph_window_open', False)
+                        and self.popup_canvas.get_tk_widget().winfo_viewable()):
                     self.update_popup_graphs()
                     
             except Exception as e:
                 print(f"Update error: {e}")
             finally:
-                self.after(1000, update)  # Schedule next update in 1 second
+                # Schedule against a fixed timeline so the period does not drift by
+                # the time spent in this tick; ticks already missed are dropped
+                self._next_tick += self._tick_period
+                now = time.monotonic()
+                if self._next_tick <= now:
+                    self._next_tick = now + self._tick_period
+                self.after(max(1, int((self._next_tick - now) * 1000)), update)
                 
         update()  # Start the update loop
+
+    def _reader_loop(self):
+        """Poll every connected instrument once per tick (runs on the reader thread).
+
+        Only publishes into self._latest_readings and self._latest_pass, one
+        update per pass, and never touches Tk. A failing pass is queued on self._reader_errors for
+        update() to log, and polling carries on.
+        """
+        next_read = time.monotonic()
+        last_error = None
+        pass_number = 0
+        while not self._reader_stop.is_set():
+            try:
+                if self.controller.is_connected():
+                    # Publish the whole pass at once so a tick never pairs readings of different passes
+                    self._latest_readings.update(
+                        self.controller.get_readings_batch(list(self.controller.instruments.keys()))
+                    )
+                    pass_number += 1
+                    self._latest_pass = (pass_number, time.time())
+                last_error = None
+            except Exception as e:
+                # Keep polling; report each new failure once rather than every pass
+                message = f"Error reading instruments: {e}"
+                if message != last_error:
+                    self._reader_errors.append(message)
+                    last_error = message
+            next_read += self._tick_period
+            now = time.monotonic()
+            if next_read <= now:
+                next_read = now  # Reads overran the period: start the next pass right away
+            self._reader_stop.wait(next_read - now)
+
+    def destroy(self):
+        """Stop the reader thread along with the window"""
+        if hasattr(self, '_reader_stop'):
+            self._reader_stop.set()
+        super().destroy()
+
     def collect_plot_data(self):
         """Collect data for plotting without actually updating any plots"""
         if not self.controller.is_connected():
@@ -1372,14 +1603,22 @@ class MainWindow(tk.Frame):
                 # Skip data collection if roles haven't been assigned yet
                 return
 
-            # Get readings for both instruments
-            readings_1 = self.controller.get_readings(address_1)
-            readings_2 = self.controller.get_readings(address_2)
+            # One sample per reader pass: skip ticks that found no new pass
+            pass_number, now = self._latest_pass
+            if pass_number == self._plotted_pass:
+                return
+            self._plotted_pass = pass_number
+
+            # Latest readings for both instruments, as published by the reader thread
+            readings_1 = self._latest_readings.get(address_1)
+            readings_2 = self._latest_readings.get(address_2)
+            if readings_1 is None or readings_2 is None:
+                return  # Not read yet
             
             # Ensure 'Flow' exists in readings
             if 'Flow' not in readings_1 or 'Flow' not in readings_2:
-                # Keep this message as it's important
-                print("Missing Flow readings in controller response")
+                if self._debug:
+                    print("Missing Flow readings in controller response")
                 return
                 
             flow1 = readings_1.get('Flow')
@@ -1390,25 +1629,15 @@ class MainWindow(tk.Frame):
                 # Skip this data point if readings failed
                 return
             
-            unit1 = readings_1.get('Unit', 'ln/min')
-            unit2 = readings_2.get('Unit', 'ln/min')
-
-            # Convert to ln/min if needed (flow values are guaranteed non-None here)
-            if unit1 in ("ml/min", "mln/min") and flow1 != 0:
-                flow1 = flow1 / 1000
-            if unit2 in ("ml/min", "mln/min") and flow2 != 0:
-                flow2 = flow2 / 1000
-
-            # Store flow data for plotting
-            now = datetime.now()
-            self.times.append(now)
-            self.flow1_data['pv'].append(flow1)
-            self.flow2_data['pv'].append(flow2)
+            # Convert to ln/min (flow values are guaranteed non-None here)
+            flow1 *= self._flow_scale.get(address_1, 1.0)
+            flow2 *= self._flow_scale.get(address_2, 1.0)
 
             # Calculate actual concentration
-            C1 = self.variables['C1_ppm'].get()
-            C2 = self.variables['C2_ppm'].get()
-            if flow1 > 0 or flow2 > 0:
+            C1 = self._conc_values['C1_ppm']
+            C2 = self._conc_values['C2_ppm']
+            # Same rule as calculate_real_outflow, so recomputed history matches
+            if flow1 + flow2 > 0:
                 actual_conc = calculate_real_outflow(C1, flow1, C2, flow2)
                 
                 # Calculate uncertainty
@@ -1453,9 +1682,7 @@ class MainWindow(tk.Frame):
                 if hasattr(self, 'uncertainty_f2_label'):
                     self.uncertainty_f2_label.config(text="—")
 
-            target_conc = self.variables['C_tot_ppm'].get()
-            self.conc_data['target'].append(target_conc)
-            self.conc_data['actual'].append(actual_conc)
+            target_conc = self._conc_values['C_tot_ppm']
 
             # Theoretical concentration from setpoints (if available)
             theoretical_conc = np.nan
@@ -1466,8 +1693,20 @@ class MainWindow(tk.Frame):
                     theoretical_conc = calculate_real_outflow(C1, float(sp1), C2, float(sp2))
             except Exception:
                 theoretical_conc = np.nan
-            self.conc_data['theoretical'].append(theoretical_conc)
-            self.uncertainty_data.append(u_C)
+
+            # Store the sample in the plot ring buffers, overwriting the oldest once full
+            i = self._buf_i
+            j = i + PLOT_MAX_POINTS  # Mirror slot, see _reset_plot_buffers
+            self._times[i] = self._times[j] = now / SECONDS_PER_DAY
+            self._flow1_pv[i] = self._flow1_pv[j] = flow1
+            self._flow2_pv[i] = self._flow2_pv[j] = flow2
+            self._conc_target[i] = self._conc_target[j] = target_conc
+            self._conc_actual[i] = self._conc_actual[j] = actual_conc
+            self._conc_theoretical[i] = self._conc_theoretical[j] = theoretical_conc
+            self._uncertainty[i] = self._uncertainty[j] = u_C
+            self._buf_i = (i + 1) % PLOT_MAX_POINTS
+            self._buf_count = min(PLOT_MAX_POINTS, self._buf_count + 1)
+            self._buf_total += 1
 
             # Update the realtime numeric readout (exact last values)
             try:
@@ -1478,29 +1717,79 @@ class MainWindow(tk.Frame):
             except Exception:
                 pass
 
-            # Remove print debug info
-            # print(f"Added data point: time={now}, flow1={flow1}, flow2={flow2}, conc={actual_conc}")
-            # print(f"Data arrays: times={len(self.times)}, flow1={len(self.flow1_data['pv'])}, flow2={len(self.flow2_data['pv'])}")
-
-            # Limit data points
-            max_points = 300
-            if len(self.times) > max_points:
-                self.times = self.times[-max_points:]
-                self.flow1_data['pv'] = self.flow1_data['pv'][-max_points:]
-                self.flow2_data['pv'] = self.flow2_data['pv'][-max_points:]
-                self.conc_data['target'] = self.conc_data['target'][-max_points:]
-                self.conc_data['actual'] = self.conc_data['actual'][-max_points:]
-                self.conc_data['theoretical'] = self.conc_data['theoretical'][-max_points:]
-                self.uncertainty_data = self.uncertainty_data[-max_points:]
-
         except Exception as e:
             print(f"Error collecting plot data: {e}")
             import traceback
             traceback.print_exc()
 
+    def _reset_plot_buffers(self):
+        """Allocate empty plot buffers holding the last PLOT_MAX_POINTS samples.
+
+        Samples are written at self._buf_i, which wraps around once the buffers
+        are full; use _ordered() to read a buffer oldest sample first. Each buffer
+        holds two copies of the window (sample i is also stored at
+        i + PLOT_MAX_POINTS), so the oldest-first samples are always one
+        contiguous slice and can be handed to matplotlib without copying.
+        """
+        self._buf_i = 0
+        self._buf_count = 0
+        self._buf_total = 0  # Samples collected since the last reset
+        size = 2 * PLOT_MAX_POINTS
+        self._times = np.zeros(size)  # Date numbers (Unix time in days), ready to plot
+        self._flow1_pv = np.zeros(size)
+        self._flow2_pv = np.zeros(size)
+        self._conc_target = np.zeros(size)
+        self._conc_actual = np.zeros(size)
+        self._conc_theoretical = np.zeros(size)  # From setpoints, NaN if unknown
+        self._uncertainty = np.zeros(size)
+
+    def _on_concentration_changed(self, key: str):
+        """Trace callback: mirror an edited concentration into self._conc_values"""
+        try:
+            value = self.variables[key].get()
+        except (tk.TclError, ValueError):
+            return  # Entry is mid-edit (e.g. empty): keep the last valid value
+        if value == self._conc_values[key]:
+            return  # Rewritten with the same value (e.g. calibration sync): nothing to redo
+        self._conc_values[key] = value
+        # Source concentrations apply to the plotted history as well
+        if key in ('C1_ppm', 'C2_ppm'):
+            self.recompute_concentration()
+
+    def recompute_concentration(self):
+        """Recompute the plotted actual concentration for the current C1/C2.
+
+        The stored flows are remixed with the new concentrations in one
+        vectorised pass.
+        """
+        C1 = self._conc_values['C1_ppm']
+        C2 = self._conc_values['C2_ppm']
+        # Both copies of the window at once; unused slots hold zero flow
+        self._conc_actual[:] = calculate_real_outflow(C1, self._flow1_pv, C2, self._flow2_pv)
+        self._rendered_state = None  # Redraw on the next tick even without a new sample
+
+    def _ordered(self, buf: np.ndarray) -> np.ndarray:
+        """Return the collected samples of a plot buffer, oldest first"""
+        if self._buf_count < PLOT_MAX_POINTS:
+            return buf[:self._buf_count]
+        i = self._buf_i
+        return buf[i:i + PLOT_MAX_POINTS]
+
+    def _format_time_axis(self, ax):
+        """Label an axis whose x data are date numbers with local clock times"""
+        import matplotlib.dates as mdates
+        from matplotlib.ticker import FuncFormatter
+        ax.xaxis.set_major_locator(mdates.AutoDateLocator(tz=LOCAL_TZ))
+        ax.xaxis.set_major_formatter(
+            FuncFormatter(lambda x, pos: _clock_label(int(round(x * SECONDS_PER_DAY))))
+        )
+
     def create_plot_canvas(self, parent):
         """Create a canvas with three subplots stacked vertically for flow and concentration monitoring with modern styling."""
-        fig = Figure(figsize=(8, 10), dpi=100)
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+        fig = Figure(figsize=(8, 10), dpi=100, constrained_layout=False)
         fig.patch.set_facecolor('#FFFFFF')
         
         # Create three subplots stacked vertically (3 rows, 1 column)
@@ -1519,10 +1808,11 @@ class MainWindow(tk.Frame):
         # Style the plots with modern aesthetics
         for ax in [ax1, ax2, ax3]:
             ax.set_facecolor('#FAFAFA')
-            ax.grid(True, linestyle='--', alpha=0.3, color=plot_colors['grid'], linewidth=0.8)
+            ax.grid(True, linestyle='--', alpha=0.3, color=plot_colors['grid'], linewidth=0.8,
+                    antialiased=False)
             ax.tick_params(axis='x', rotation=45, labelsize=9, colors=self.colors['text'])
             ax.tick_params(axis='y', labelsize=9, colors=self.colors['text'])
-            ax.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M:%S'))
+            self._format_time_axis(ax)
             ax.spines['top'].set_visible(False)
             ax.spines['right'].set_visible(False)
             ax.spines['left'].set_color('#BDC3C7')
@@ -1537,293 +1827,276 @@ class MainWindow(tk.Frame):
         
         return fig, ax1, ax2, ax3, canvas
 
+    def _init_live_plots(self):
+        """Create the persistent artists of the main window plots.
+
+        update_plots only moves new data into these artists. The data artists are
+        animated: a full draw renders the static parts (axes, ticks, titles,
+        legends) and caches them as a background in _on_plot_draw, and an update
+        that leaves every axis limit unchanged only blits the data artists over it.
+        Being redrawn on every refresh, the data artists skip antialiasing.
+        """
+        from matplotlib.patches import Patch
+
+        # Modern colors for plots
+        color_flow1 = '#3498DB'  # Blue
+        color_flow2 = '#2ECC71'  # Green
+        color_actual = '#3498DB'  # Blue
+        color_target = '#E74C3C'  # Red
+
+        def waiting_text(ax):
+            return ax.text(0.5, 0.5, 'Waiting for data...',
+                           horizontalalignment='center',
+                           verticalalignment='center',
+                           transform=ax.transAxes,
+                           fontsize=10,
+                           color='#95A5A6')
+
+        def last_text(ax):
+            return ax.text(0.02, 0.95, "", transform=ax.transAxes, va='top', ha='left',
+                           fontsize=9, color=self.colors['text'], animated=True)
+
+        self._flow_artists = []
+        for ax, title, color in ((self.ax1, 'Base Gas Flow', color_flow1),
+                                 (self.ax2, 'Variable Gas Flow', color_flow2)):
+            ax.set_title(title, fontsize=11, fontweight='bold', color=self.colors['primary'], pad=10)
+            ax.set_ylabel('ln/min', fontsize=9, color=self.colors['text'])
+            line, = ax.plot([], [], color=color, linewidth=2.5, label='Measured', alpha=0.9,
+                            animated=True, antialiased=False)
+            setpoint = ax.axhline(y=0, color='#E74C3C', linestyle='--', linewidth=1.5,
+                                  alpha=0.7, visible=False, animated=True, antialiased=False)
+            ax.set_autoscale_on(False)  # Limits are managed by _render_live_plots
+            self._flow_artists.append({
+                'ax': ax, 'color': color, 'line': line, 'setpoint': setpoint, 'fill': None,
+                'last': last_text(ax), 'waiting': waiting_text(ax), 'legend_key': None,
+            })
+
+        ax = self.ax3
+        ax.set_title('Concentration with Uncertainty', fontsize=11, fontweight='bold',
+                     color=self.colors['primary'], pad=10)
+        ax.set_ylabel('ppm', fontsize=9, color=self.colors['text'])
+        ax.set_xlabel('Time', fontsize=9, color=self.colors['text'])
+        ax.set_autoscale_on(False)
+        self._conc_artists = {
+            'ax': ax,
+            'color': color_actual,
+            'actual': ax.plot([], [], color=color_actual, linewidth=2.5, label='Actual',
+                              alpha=0.9, zorder=3, animated=True, antialiased=False)[0],
+            'target': ax.plot([], [], color=color_target, linewidth=2, linestyle='--',
+                              label='Target', alpha=0.8, zorder=2, animated=True,
+                              antialiased=False)[0],
+            'theory': ax.plot([], [], color=color_target, marker='o', markersize=3,
+                              linewidth=1.2, label='Theoretical (setpoints)', alpha=0.9,
+                              zorder=4, animated=True, antialiased=False)[0],
+            # Legend entry for the uncertainty band, which is rebuilt on every update
+            'band_proxy': Patch(facecolor=color_actual, alpha=0.2, label='±1σ uncertainty'),
+            'band': None,
+            'last': last_text(ax),
+            'waiting': waiting_text(ax),
+            'legend_key': None,
+        }
+
+        self._plot_background = None
+        self._plot_limits = None
+        self._rendered_state = None
+        self.canvas.mpl_connect('draw_event', self._on_plot_draw)
+        # update_plots skips hidden windows; catch up as soon as it is shown again.
+        # Restoring an iconified window only maps the toplevel, not the canvas
+        self.winfo_toplevel().bind('<Map>', self._on_toplevel_map, add='+')
+
+    def _on_toplevel_map(self, event):
+        """Redraw the plots when the main window is deiconified"""
+        if event.widget is self.winfo_toplevel():
+            self.after_idle(self.update_plots)
+
+    def _animated_plot_artists(self):
+        """Return the data artists drawn on top of the cached plot background"""
+        artists = []
+        for flow in self._flow_artists:
+            artists.extend((flow['fill'], flow['line'], flow['setpoint'], flow['last']))
+        conc = self._conc_artists
+        artists.extend((conc['band'], conc['target'], conc['actual'], conc['theory'], conc['last']))
+        return [artist for artist in artists if artist is not None]
+
+    def _on_plot_draw(self, event):
+        """After a full draw, cache the static background and draw the data on it"""
+        self._plot_background = self.canvas.copy_from_bbox(self.fig.bbox)
+        for artist in self._animated_plot_artists():
+            self.fig.draw_artist(artist)
+
+    def _set_legend(self, artists, handles):
+        """Rebuild an axis legend when its entries change; return True if it did"""
+        key = tuple(handle.get_label() for handle in handles)
+        if key == artists['legend_key']:
+            return False
+        artists['legend_key'] = key
+        legend = artists['ax'].get_legend()
+        if legend is not None:
+            legend.remove()
+        if handles:
+            artists['ax'].legend(handles=handles, loc='upper right', fontsize=8, framealpha=0.9)
+        return True
+
     def update_plots(self):
         """Update the main window plots with current data using modern styling"""
-        if not self.controller.is_connected() or not hasattr(self, 'ax1'):
+        if not self.controller.is_connected() or not hasattr(self, '_flow_artists'):
             return  # Skip plot updates if not connected or plots not initialized
+        if not self.canvas.get_tk_widget().winfo_viewable():
+            return  # Window minimized: the buffers keep filling, draw when shown again
 
         try:
-            # Modern colors for plots
-            color_flow1 = '#3498DB'  # Blue
-            color_flow2 = '#2ECC71'  # Green
-            color_actual = '#3498DB'  # Blue
-            color_target = '#E74C3C'  # Red
-            
-            # --- Plot Flow 1 ---
-            self.ax1.clear()
-            self.ax1.set_title('Base Gas Flow', fontsize=11, fontweight='bold', color=self.colors['primary'], pad=10)
-            self.ax1.set_ylabel('ln/min', fontsize=9, color=self.colors['text'])
-            self.ax1.set_facecolor('#FAFAFA')
-            self.ax1.grid(True, linestyle='--', alpha=0.3, color='#ECF0F1', linewidth=0.8)
-            self.ax1.spines['top'].set_visible(False)
-            self.ax1.spines['right'].set_visible(False)
-            self.ax1.spines['left'].set_color('#BDC3C7')
-            self.ax1.spines['bottom'].set_color('#BDC3C7')
-            
-            if self.flow1_data['pv']:
-                self.ax1.plot(self.times, self.flow1_data['pv'], color=color_flow1, 
-                            linewidth=2.5, label='Measured', alpha=0.9)
-                self.ax1.fill_between(self.times, self.flow1_data['pv'], alpha=0.1, color=color_flow1)
+            self._render_live_plots()
+        except Exception as e:
+            print(f"Error updating main plots: {e}")
 
+    def _render_live_plots(self):
+        """Push the buffered samples into the plot artists and redraw"""
+        address_2_raw = self.instrument_addresses.get('gas2')
+        addresses = (self.instrument_addresses.get('gas1'),
+                     self.current_gas2_address if address_2_raw == 'auto' else address_2_raw)
+        setpoints = tuple(self.controller.setpoints.get(address) if address else None
+                          for address in addresses)
+        show_theoretical = bool(self.show_theoretical_var.get())
+        # Nothing new since the last render (no sample, setpoint or option change)
+        state = (self._buf_total, setpoints, show_theoretical)
+        if state == self._rendered_state:
+            return
+        self._rendered_state = state
+
+        count = self._buf_count
+        # Oldest-first views of the collected samples
+        times = self._ordered(self._times)
+        layout_changed = False
+
+        # --- Flows ---
+        for flow_artists, buf, setpoint in zip(self._flow_artists, (self._flow1_pv, self._flow2_pv), setpoints):
+            ax = flow_artists['ax']
+            flow = self._ordered(buf)
+            flow_artists['line'].set_data(times, flow)
+            if flow_artists['fill'] is not None:
+                flow_artists['fill'].remove()
+                flow_artists['fill'] = None
+            setpoint_line = flow_artists['setpoint']
+            handles = []
+            if count:
+                flow_artists['fill'] = ax.fill_between(times, flow, alpha=0.1, color=flow_artists['color'],
+                                                       animated=True, antialiased=False)
                 # Show last value on the plot
-                try:
-                    last_val = float(self.flow1_data['pv'][-1])
-                    self.ax1.text(
-                        0.02,
-                        0.95,
-                        f"Last: {last_val:.6f}",
-                        transform=self.ax1.transAxes,
-                        va='top',
-                        ha='left',
-                        fontsize=9,
-                        color=self.colors['text'],
-                    )
-                except Exception:
-                    pass
-                
-                # Add setpoint line if available
-                address_1 = self.instrument_addresses.get('gas1')
-                if address_1 and address_1 in self.controller.setpoints:
-                    setpoint = self.controller.setpoints[address_1]
-                    self.ax1.axhline(y=setpoint, color='#E74C3C', linestyle='--', 
-                                   linewidth=1.5, label=f'Setpoint: {setpoint:.3f}', alpha=0.7)
-                
-                self.ax1.legend(loc='upper right', fontsize=8, framealpha=0.9)
-            else:
-                self.ax1.text(0.5, 0.5, 'Waiting for data...', 
-                            horizontalalignment='center',
-                            verticalalignment='center', 
-                            transform=self.ax1.transAxes,
-                            fontsize=10,
-                            color='#95A5A6')
-
-            # --- Plot Flow 2 ---
-            self.ax2.clear()
-            self.ax2.set_title('Variable Gas Flow', fontsize=11, fontweight='bold', color=self.colors['primary'], pad=10)
-            self.ax2.set_ylabel('ln/min', fontsize=9, color=self.colors['text'])
-            self.ax2.set_facecolor('#FAFAFA')
-            self.ax2.grid(True, linestyle='--', alpha=0.3, color='#ECF0F1', linewidth=0.8)
-            self.ax2.spines['top'].set_visible(False)
-            self.ax2.spines['right'].set_visible(False)
-            self.ax2.spines['left'].set_color('#BDC3C7')
-            self.ax2.spines['bottom'].set_color('#BDC3C7')
-            
-            if self.flow2_data['pv']:
-                self.ax2.plot(self.times, self.flow2_data['pv'], color=color_flow2, 
-                            linewidth=2.5, label='Measured', alpha=0.9)
-                self.ax2.fill_between(self.times, self.flow2_data['pv'], alpha=0.1, color=color_flow2)
+                flow_artists['last'].set_text(f"Last: {flow[-1]:.6f}")
 
-                # Show last value on the plot
-                try:
-                    last_val = float(self.flow2_data['pv'][-1])
-                    self.ax2.text(
-                        0.02,
-                        0.95,
-                        f"Last: {last_val:.6f}",
-                        transform=self.ax2.transAxes,
-                        va='top',
-                        ha='left',
-                        fontsize=9,
-                        color=self.colors['text'],
-                    )
-                except Exception:
-                    pass
-                
                 # Add setpoint line if available
-                address_2_raw = self.instrument_addresses.get('gas2')
-                address_2 = self.current_gas2_address if address_2_raw == 'auto' else address_2_raw
-                if address_2 and address_2 in self.controller.setpoints:
-                    setpoint = self.controller.setpoints[address_2]
-                    self.ax2.axhline(y=setpoint, color='#E74C3C', linestyle='--', 
-                                   linewidth=1.5, label=f'Setpoint: {setpoint:.3f}', alpha=0.7)
-                
-                self.ax2.legend(loc='upper right', fontsize=8, framealpha=0.9)
+                handles.append(flow_artists['line'])
+                if setpoint is not None:
+                    setpoint_line.set_ydata([setpoint, setpoint])
+                    setpoint_line.set_label(f'Setpoint: {setpoint:.3f}')
+                    handles.append(setpoint_line)
+                setpoint_line.set_visible(setpoint is not None)
             else:
-                self.ax2.text(0.5, 0.5, 'Waiting for data...', 
-                            horizontalalignment='center',
-                            verticalalignment='center', 
-                            transform=self.ax2.transAxes,
-                            fontsize=10,
-                            color='#95A5A6')
-
-            # --- Plot Concentration ---
-            self.ax3.clear()
-            self.ax3.set_title('Concentration with Uncertainty', fontsize=11, fontweight='bold', color=self.colors['primary'], pad=10)
-            self.ax3.set_ylabel('ppm', fontsize=9, color=self.colors['text'])
-            self.ax3.set_xlabel('Time', fontsize=9, color=self.colors['text'])
-            self.ax3.set_facecolor('#FAFAFA')
-            self.ax3.grid(True, linestyle='--', alpha=0.3, color='#ECF0F1', linewidth=0.8)
-            self.ax3.spines['top'].set_visible(False)
-            self.ax3.spines['right'].set_visible(False)
-            self.ax3.spines['left'].set_color('#BDC3C7')
-            self.ax3.spines['bottom'].set_color('#BDC3C7')
-            
-            if self.conc_data['actual'] and len(self.uncertainty_data) > 0:
-                actual_conc = np.array(self.conc_data['actual'])
-                uncertainty = np.array(self.uncertainty_data)
-                
-                # Main line for actual concentration
-                self.ax3.plot(self.times, actual_conc, color=color_actual, 
-                            linewidth=2.5, label='Actual', alpha=0.9, zorder=3)
-
-                # Show last value on the plot
-                try:
-                    last_val = float(actual_conc[-1])
-                    self.ax3.text(
-                        0.02,
-                        0.95,
-                        f"Last: {last_val:.3f} ppm",
-                        transform=self.ax3.transAxes,
-                        va='top',
-                        ha='left',
-                        fontsize=9,
-                        color=self.colors['text'],
-                    )
-                except Exception:
-                    pass
-                
-                # Target line
-                self.ax3.plot(self.times, self.conc_data['target'], color=color_target, 
-                            linewidth=2, linestyle='--', label='Target', alpha=0.8, zorder=2)
-
-                # Theoretical (calculated) concentration from setpoints (optional)
-                if getattr(self, 'show_theoretical_var', None) is not None and self.show_theoretical_var.get():
-                    theory = np.array(self.conc_data.get('theoretical', []), dtype=float)
-                    if theory.size == len(self.times):
-                        mask = np.isfinite(theory)
-                        if np.any(mask):
-                            t_arr = np.array(self.times, dtype=object)
-                            self.ax3.plot(
-                                t_arr[mask],
-                                theory[mask],
-                                color=color_target,
-                                marker='o',
-                                markersize=3,
-                                linewidth=1.2,
-                                label='Theoretical (setpoints)',
-                                alpha=0.9,
-                                zorder=4,
-                            )
-                
-                # Error band (±1 sigma uncertainty)
-                self.ax3.fill_between(self.times, 
-                                     actual_conc - uncertainty, 
-                                     actual_conc + uncertainty,
-                                     alpha=0.2, color=color_actual, 
-                                     label='±1σ uncertainty',
-                                     zorder=1)
-                
-                self.ax3.legend(loc='upper right', fontsize=8, framealpha=0.9)
-            elif self.conc_data['actual']:
-                # Fallback if uncertainty data not available
-                self.ax3.plot(self.times, self.conc_data['actual'], color=color_actual, 
-                            linewidth=2.5, label='Actual', alpha=0.9)
-                self.ax3.plot(self.times, self.conc_data['target'], color=color_target, 
-                            linewidth=2, linestyle='--', label='Target', alpha=0.8)
-                try:
-                    last_val = float(self.conc_data['actual'][-1])
-                    self.ax3.text(
-                        0.02,
-                        0.95,
-                        f"Last: {last_val:.3f} ppm",
-                        transform=self.ax3.transAxes,
-                        va='top',
-                        ha='left',
-                        fontsize=9,
-                        color=self.colors['text'],
-                    )
-                except Exception:
-                    pass
-                if getattr(self, 'show_theoretical_var', None) is not None and self.show_theoretical_var.get():
-                    theory = np.array(self.conc_data.get('theoretical', []), dtype=float)
-                    if theory.size == len(self.times):
-                        mask = np.isfinite(theory)
-                        if np.any(mask):
-                            t_arr = np.array(self.times, dtype=object)
-                            self.ax3.plot(
-                                t_arr[mask],
-                                theory[mask],
-                                color=color_target,
-                                marker='o',
-                                markersize=3,
-                                linewidth=1.2,
-                                label='Theoretical (setpoints)',
-                                alpha=0.9,
-                                zorder=4,
-                            )
-                self.ax3.fill_between(self.times, self.conc_data['actual'], alpha=0.1, color=color_actual)
-                self.ax3.legend(loc='upper right', fontsize=8, framealpha=0.9)
-
-            # Use draw_idle() instead of draw() for better performance
-            # draw_idle() defers the actual drawing until the GUI is idle
+                flow_artists['last'].set_text("")
+                setpoint_line.set_visible(False)
+            layout_changed |= self._set_legend(flow_artists, handles)
+            if flow_artists['waiting'].get_visible() != (not count):
+                flow_artists['waiting'].set_visible(not count)
+                layout_changed = True
+            if count:
+                # The filled area reaches down to 0
+                low, high = min(0.0, flow.min()), flow.max()
+                if setpoint is not None:
+                    low, high = min(low, setpoint), max(high, setpoint)
+                self._update_ylim(ax, low, high)
+
+        # --- Concentration ---
+        conc = self._conc_artists
+        ax = conc['ax']
+        actual_conc = self._ordered(self._conc_actual)
+        uncertainty = self._ordered(self._uncertainty)
+        conc['actual'].set_data(times, actual_conc)
+        conc['target'].set_data(times, self._ordered(self._conc_target))
+        if conc['band'] is not None:
+            conc['band'].remove()
+            conc['band'] = None
+        handles = []
+        if count:
+            # Show last value on the plot
+            conc['last'].set_text(f"Last: {actual_conc[-1]:.3f} ppm")
+
+            # Theoretical (calculated) concentration from setpoints (optional)
+            theory = self._ordered(self._conc_theoretical)
+            mask = np.isfinite(theory)
+            show_theory = show_theoretical and bool(np.any(mask))
+            conc['theory'].set_data(times[mask], theory[mask])
+            conc['theory'].set_visible(show_theory)
+
+            # Error band (±1 sigma uncertainty)
+            low = actual_conc - uncertainty
+            high = actual_conc + uncertainty
+            conc['band'] = ax.fill_between(times, low, high, alpha=0.2, color=conc['color'],
+                                           zorder=1, animated=True, antialiased=False)
+            handles = [conc['actual'], conc['target']]
+            if show_theory:
+                handles.append(conc['theory'])
+            handles.append(conc['band_proxy'])
+        else:
+            conc['last'].set_text("")
+            conc['theory'].set_visible(False)
+        layout_changed |= self._set_legend(conc, handles)
+        if conc['waiting'].get_visible() != (not count):
+            conc['waiting'].set_visible(not count)
+            layout_changed = True
+        if count:
+            shown = [low, high, self._ordered(self._conc_target)]
+            if show_theory:
+                shown.append(theory[mask])
+            self._update_ylim(ax, min(np.nanmin(y) for y in shown), max(np.nanmax(y) for y in shown))
+        if count:
+            self._update_xlim((self.ax1, self.ax2, self.ax3))
+
+        # Blit the data over the cached background unless something static moved
+        limits = tuple(ax.get_xlim() + ax.get_ylim() for ax in (self.ax1, self.ax2, self.ax3))
+        if layout_changed or limits != self._plot_limits or self._plot_background is None:
+            self._plot_limits = limits
             self.canvas.draw_idle()
-        except Exception as e:
-            print(f"Error updating main plots: {e}")
+        else:
+            self.canvas.restore_region(self._plot_background)
+            for artist in self._animated_plot_artists():
+                self.fig.draw_artist(artist)
+            self.canvas.blit(self.fig.bbox)
     
+    def _update_xlim(self, axes):
+        """Show the sample window on the given axes, advancing in PLOT_X_STEP steps"""
+        last = self._times[(self._buf_i - 1) % PLOT_MAX_POINTS] * SECONDS_PER_DAY
+        x_max = np.ceil(last / PLOT_X_STEP) * PLOT_X_STEP
+        x_min = x_max - PLOT_X_STEP - PLOT_MAX_POINTS * self._tick_period
+        limits = (x_min / SECONDS_PER_DAY, x_max / SECONDS_PER_DAY)
+        for ax in axes:
+            if ax.get_xlim() != limits:
+                ax.set_xlim(limits)
+
+    @staticmethod
+    def _update_ylim(ax, low: float, high: float):
+        """Keep [low, high] inside the y limits of ax, changing them only when needed.
+
+        The limits are recomputed when the data leave them or use less than
+        half of the axis, so small changes between samples don't move them.
+        """
+        if not (np.isfinite(low) and np.isfinite(high)):
+            return
+        y_min, y_max = ax.get_ylim()
+        span = high - low
+        if y_min <= low and high <= y_max and span >= 0.5 * (y_max - y_min):
+            return
+        margin = PLOT_Y_MARGIN * span if span > 0 else max(abs(high) * PLOT_Y_MARGIN, 1e-3)
+        ax.set_ylim(low - margin, high + margin)
+
     def reset_graphs(self):
         """Reset all graph axes and clear data"""
         try:
             # Clear all data arrays
-            self.times = []
-            self.flow1_data = {'pv': []}
-            self.flow2_data = {'pv': []}
-            self.conc_data = {'target': [], 'actual': [], 'theoretical': []}
-            self.uncertainty_data = []
-            
-            # Clear all three axes
-            if hasattr(self, 'ax1'):
-                self.ax1.clear()
-                self.ax1.set_facecolor('#FAFAFA')
-                self.ax1.grid(True, linestyle='--', alpha=0.3, color='#ECF0F1', linewidth=0.8)
-                self.ax1.set_ylabel('Flow (ln/min)', fontsize=10, fontweight='bold', color=self.colors['text'])
-                self.ax1.set_title('Base Gas Flow', fontsize=11, fontweight='bold', color=self.colors['primary'], pad=10)
-                self.ax1.tick_params(axis='x', rotation=45, labelsize=9, colors=self.colors['text'])
-                self.ax1.tick_params(axis='y', labelsize=9, colors=self.colors['text'])
-                self.ax1.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M:%S'))
-                self.ax1.spines['top'].set_visible(False)
-                self.ax1.spines['right'].set_visible(False)
-                self.ax1.spines['left'].set_color('#BDC3C7')
-                self.ax1.spines['bottom'].set_color('#BDC3C7')
-                self.ax1.spines['left'].set_linewidth(1.5)
-                self.ax1.spines['bottom'].set_linewidth(1.5)
+            self._reset_plot_buffers()
             
-            if hasattr(self, 'ax2'):
-                self.ax2.clear()
-                self.ax2.set_facecolor('#FAFAFA')
-                self.ax2.grid(True, linestyle='--', alpha=0.3, color='#ECF0F1', linewidth=0.8)
-                self.ax2.set_ylabel('Flow (ln/min)', fontsize=10, fontweight='bold', color=self.colors['text'])
-                self.ax2.set_title('Variable Gas Flow', fontsize=11, fontweight='bold', color=self.colors['primary'], pad=10)
-                self.ax2.tick_params(axis='x', rotation=45, labelsize=9, colors=self.colors['text'])
-                self.ax2.tick_params(axis='y', labelsize=9, colors=self.colors['text'])
-                self.ax2.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M:%S'))
-                self.ax2.spines['top'].set_visible(False)
-                self.ax2.spines['right'].set_visible(False)
-                self.ax2.spines['left'].set_color('#BDC3C7')
-                self.ax2.spines['bottom'].set_color('#BDC3C7')
-                self.ax2.spines['left'].set_linewidth(1.5)
-                self.ax2.spines['bottom'].set_linewidth(1.5)
-            
-            if hasattr(self, 'ax3'):
-                self.ax3.clear()
-                self.ax3.set_facecolor('#FAFAFA')
-                self.ax3.grid(True, linestyle='--', alpha=0.3, color='#ECF0F1', linewidth=0.8)
-                self.ax3.set_xlabel('Time', fontsize=10, fontweight='bold', color=self.colors['text'])
-                self.ax3.set_ylabel('Concentration (ppm)', fontsize=10, fontweight='bold', color=self.colors['text'])
-                self.ax3.set_title('Concentration with Uncertainty', fontsize=11, fontweight='bold', color=self.colors['primary'], pad=10)
-                self.ax3.tick_params(axis='x', rotation=45, labelsize=9, colors=self.colors['text'])
-                self.ax3.tick_params(axis='y', labelsize=9, colors=self.colors['text'])
-                self.ax3.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M:%S'))
-                self.ax3.spines['top'].set_visible(False)
-                self.ax3.spines['right'].set_visible(False)
-                self.ax3.spines['left'].set_color('#BDC3C7')
-                self.ax3.spines['bottom'].set_color('#BDC3C7')
-                self.ax3.spines['left'].set_linewidth(1.5)
-                self.ax3.spines['bottom'].set_linewidth(1.5)
-            
-            # Redraw the canvas
-            if hasattr(self, 'canvas'):
-                self.fig.tight_layout(pad=2.5)
-                self.canvas.draw_idle()
+            # Redraw the empty plots
+            if hasattr(self, '_flow_artists'):
+                self._render_live_plots()
             
             self.print_to_command_output("Graphs reset successfully", 'success')
             
@@ -1839,16 +2112,44 @@ class MainWindow(tk.Frame):
         
         # Store window-specific plot objects
         self.popup_fig, self.popup_ax1, self.popup_ax2, self.popup_ax3, self.popup_canvas = self.create_plot_canvas(graph_win)
+
+        # Static decorations and the data lines are created once; updates only
+        # move new data into the lines. The lines are animated and blitted over
+        # a background cached after each full draw, like the main window plots.
+        self.popup_lines = {
+            'flow1': self.popup_ax1.plot([], [], 'b-', label='Measured', animated=True,
+                                         antialiased=False)[0],
+            'flow2': self.popup_ax2.plot([], [], 'g-', label='Measured', animated=True,
+                                         antialiased=False)[0],
+            'actual': self.popup_ax3.plot([], [], 'b-', label='Actual', animated=True,
+                                          antialiased=False)[0],
+            'target': self.popup_ax3.plot([], [], 'r--', label='Target', animated=True,
+                                          antialiased=False)[0],
+        }
+        self.popup_ax1.set_title('Flow 1')
+        self.popup_ax1.set_ylabel('ln/min')
+        self.popup_ax2.set_title('Flow 2')
+        self.popup_ax2.set_ylabel('ln/min')
+        self.popup_ax3.set_title('Concentration')
+        self.popup_ax3.set_ylabel('ppm')
+        self.popup_ax3.set_xlabel('Time')
+        self.popup_waiting = []
+        for ax in [self.popup_ax1, self.popup_ax2, self.popup_ax3]:
+            ax.set_autoscale_on(False)  # Limits are managed by update_popup_graphs
+            ax.legend(loc='upper left')
+            ax.grid(True, linestyle='--', alpha=0.7, antialiased=False)
+            self.popup_waiting.append(ax.text(0.5, 0.5, 'Waiting for data...', 
+                                              horizontalalignment='center',
+                                              verticalalignment='center', 
+                                              transform=ax.transAxes))
+        self.popup_background = None
+        self.popup_limits = None
+        self.popup_canvas.mpl_connect('draw_event', self._on_popup_draw)
         
         # Initial data population
-        if self.times:
+        if self._buf_count:
             self.update_popup_graphs()
         else:
-            for ax in [self.popup_ax1, self.popup_ax2, self.popup_ax3]:
-                ax.text(0.5, 0.5, 'Waiting for data...', 
-                       horizontalalignment='center',
-                       verticalalignment='center', 
-                       transform=ax.transAxes)
             self.popup_canvas.draw()
         
         # When window is closed, reset the graph_window_open flag
@@ -1869,75 +2170,80 @@ class MainWindow(tk.Frame):
             del self.popup_ax3
         if hasattr(self, 'popup_canvas'):
             del self.popup_canvas
+        if hasattr(self, 'popup_lines'):
+            del self.popup_lines
+        if hasattr(self, 'popup_waiting'):
+            del self.popup_waiting
+        self.popup_background = None
+
+    def _on_popup_draw(self, event):
+        """After a full draw of the popup, cache its background and draw the lines on it"""
+        if not hasattr(self, 'popup_lines'):
+            return
+        self.popup_background = self.popup_canvas.copy_from_bbox(self.popup_fig.bbox)
+        for line in self.popup_lines.values():
+            self.popup_fig.draw_artist(line)
 
     def update_popup_graphs(self):
         """Update only the popup window graphs"""
         if not hasattr(self, 'popup_ax1') or not self.graph_window_open:
             return
             
-        # Clear previous plots
-        self.popup_ax1.clear()
-        self.popup_ax2.clear()
-        self.popup_ax3.clear()
-        
-        # Plot Flow 1
-        self.popup_ax1.plot(self.times, self.flow1_data['pv'], 'b-', label='Measured')
-        self.popup_ax1.set_title('Flow 1')
-        self.popup_ax1.set_ylabel('ln/min')
-        self.popup_ax1.legend(loc='best')
-        self.popup_ax1.grid(True, linestyle='--', alpha=0.7)
-
-        # Plot Flow 2
-        self.popup_ax2.plot(self.times, self.flow2_data['pv'], 'g-', label='Measured')
-        self.popup_ax2.set_title('Flow 2')
-        self.popup_ax2.set_ylabel('ln/min')
-        self.popup_ax2.legend(loc='best')
-        self.popup_ax2.grid(True, linestyle='--', alpha=0.7)
-
-        # Plot Concentration
-        self.popup_ax3.plot(self.times, self.conc_data['actual'], 'b-', label='Actual')
-        self.popup_ax3.plot(self.times, self.conc_data['target'], 'r--', label='Target')
-        self.popup_ax3.set_title('Concentration')
-        self.popup_ax3.set_ylabel('ppm')
-        self.popup_ax3.set_xlabel('Time')
-        self.popup_ax3.legend(loc='best')
-        self.popup_ax3.grid(True, linestyle='--', alpha=0.7)
-        
-        # Use draw_idle() for better performance
-        self.popup_canvas.draw_idle()
+        times = self._ordered(self._times)
+
+        # Move the buffered samples into the persistent lines
+        lines = self.popup_lines
+        lines['flow1'].set_data(times, self._ordered(self._flow1_pv))
+        lines['flow2'].set_data(times, self._ordered(self._flow2_pv))
+        lines['actual'].set_data(times, self._ordered(self._conc_actual))
+        lines['target'].set_data(times, self._ordered(self._conc_target))
+        axes = (self.popup_ax1, self.popup_ax2, self.popup_ax3)
+        count = self._buf_count
+        layout_changed = False
+        for waiting in self.popup_waiting:
+            if waiting.get_visible() != (not count):
+                waiting.set_visible(not count)
+                layout_changed = True
+        if count:
+            for ax, line_keys in zip(axes, (('flow1',), ('flow2',), ('actual', 'target'))):
+                shown = [lines[key].get_ydata() for key in line_keys]
+                self._update_ylim(ax, min(np.nanmin(y) for y in shown), max(np.nanmax(y) for y in shown))
+            self._update_xlim(axes)
+
+        # Blit the lines over the cached background unless something static moved
+        limits = tuple(ax.get_xlim() + ax.get_ylim() for ax in axes)
+        if layout_changed or limits != self.popup_limits or self.popup_background is None:
+            self.popup_limits = limits
+            self.popup_canvas.draw_idle()
+        else:
+            self.popup_canvas.restore_region(self.popup_background)
+            for line in lines.values():
+                self.popup_fig.draw_artist(line)
+            self.popup_canvas.blit(self.popup_fig.bbox)
 
     def update_readings(self):
         """Update instrument readings in the UI"""
         if not self.controller.is_connected():
             return
             
-        # Update readings for all connected instruments
-        for addr in self.controller.instruments.keys():
-            if addr in self.reading_labels:
-                try:
-                    # Get readings from controller
-                    readings = self.controller.get_readings(addr)
-                    
-                    # Update each parameter label
-                    for param in ['Flow', 'Valve', 'Temperature']:
-                        if param in readings and param in self.reading_labels[addr]:
-                            value = readings[param]
-                            
-                            # Format value based on parameter type
-                            if param == 'Flow':
-                                formatted = f"{value:.3f}" if value is not None else "---"
-                            elif param == 'Valve':
-                                formatted = f"{value:.1f}" if value is not None else "---"
-                            elif param == 'Temperature':
-                                formatted = f"{value:.1f}" if value is not None else "---"
-                            else:
-                                formatted = str(value) if value is not None else "---"
-                                
-                            self.reading_labels[addr][param].config(text=formatted)
+        # Update readings for every instrument card
+        latest = self._latest_readings
+        shown = self._reading_texts
+        for addr, labels in self._reading_widgets:
+            try:
+                # Latest readings published by the reader thread
+                readings = latest.get(addr)
+                if readings is None:
+                    continue
+                
+                # Update each parameter label whose text changed
+                for param, fmt, label in zip(READING_PARAMS, READING_FORMATS, labels):
+                    if param in readings:
+                        value = readings[param]
+                        text = fmt.format(value) if value is not None else "---"
+                        if text != shown[label]:
+                            shown[label] = text
+                            label.config(text=text)
                     
-                    # Update unit label if available
-                    if 'Unit' in readings and 'Unit' in self.reading_labels[addr]:
-                        self.reading_labels[addr]['Unit'].config(text=readings['Unit'])
-                        
-                except Exception as e:
-                    print(f"Error updating readings for address {addr}: {e}")
\ No newline at end of file
+            except Exception as e:
+                print(f"Error updating readings for address {addr}: {e}")
\ No newline at end of file